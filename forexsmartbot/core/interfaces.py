@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 
@@ -81,6 +82,40 @@ class Position:
         return profit_pips >= risk_pips * 1.5
 
 
+@dataclass
+class PositionArray:
+    """Struct-of-arrays view of open positions, one row per position."""
+    symbols: np.ndarray      # object
+    sides: np.ndarray        # int8, +1 long / -1 short
+    quantity: np.ndarray     # float64
+    entry_price: np.ndarray  # float64
+    current_price: np.ndarray  # float64
+    stop_loss: np.ndarray    # float64, NaN when unset
+    take_profit: np.ndarray  # float64, NaN when unset
+    symbol_to_row: Dict[str, int] = None
+    
+    def __post_init__(self):
+        if self.symbol_to_row is None:
+            self.symbol_to_row = {symbol: row for row, symbol in enumerate(self.symbols)}
+    
+    def __len__(self) -> int:
+        return len(self.symbols)
+    
+    @classmethod
+    def from_positions(cls, positions: List['Position']) -> 'PositionArray':
+        """Pack a list of positions into columns; unset SL/TP become NaN."""
+        n = len(positions)
+        return cls(
+            symbols=np.array([p.symbol for p in positions], dtype=object),
+            sides=np.fromiter((p.side for p in positions), dtype=np.int8, count=n),
+            quantity=np.fromiter((p.quantity for p in positions), dtype=float, count=n),
+            entry_price=np.fromiter((p.entry_price for p in positions), dtype=float, count=n),
+            current_price=np.fromiter((p.current_price for p in positions), dtype=float, count=n),
+            stop_loss=np.fromiter((p.stop_loss or np.nan for p in positions), dtype=float, count=n),
+            take_profit=np.fromiter((p.take_profit or np.nan for p in positions), dtype=float, count=n),
+        )
+
+
 @dataclass
 class Trade:
     """Represents a completed trade with advanced management details."""
@@ -1,5 +1,6 @@
 """Trading controller for orchestrating the trading system."""
 
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Callable
 from datetime import datetime
@@ -7,7 +8,7 @@ from PyQt6.QtCore import QTimer, QObject, pyqtSignal
 
 from ..core.interfaces import IBroker, IStrategy, IDataProvider, IRiskManager
 from ..core.portfolio import Portfolio
-from ..core.interfaces import Trade, Position
+from ..core.interfaces import Trade, Position, PositionArray
 from ..core.trade_manager import TradeManager
 
 
@@ -20,6 +21,7 @@ class TradingController(QObject):
     signal_equity_updated = pyqtSignal(float)  # Equity updated
     signal_error_occurred = pyqtSignal(str)  # Error occurred
     signal_log_message = pyqtSignal(str)  # Log message
+    signal_tick_snapshot = pyqtSignal(dict)  # Aggregated state, once per trading cycle
     
     def __init__(self, broker: IBroker, data_provider: IDataProvider, 
                  risk_manager: IRiskManager, portfolio: Portfolio):
@@ -40,11 +42,29 @@ class TradingController(QObject):
         # Trading state
         self.current_positions: Dict[str, Position] = {}
         self.last_signals: Dict[str, int] = {}
+        self._positions_view: Optional[PositionArray] = None  # rebuilt only when positions open or close
         
         # Timer for periodic updates
         self.timer = QTimer()
         self.timer.timeout.connect(self._trading_cycle)
         
+    def positions_view(self) -> PositionArray:
+        """Columnar view of the open positions, rebuilt only after one opens or closes."""
+        if self._positions_view is None:
+            self._positions_view = PositionArray.from_positions(list(self.current_positions.values()))
+        return self._positions_view
+        
+    def _update_view_row(self, symbol: str, position: Position) -> None:
+        """Write a position's current price, size and stops into its row of the cached view."""
+        view = self._positions_view
+        if view is None:
+            return
+        row = view.symbol_to_row[symbol]
+        view.quantity[row] = position.quantity
+        view.current_price[row] = position.current_price
+        view.stop_loss[row] = position.stop_loss or np.nan
+        view.take_profit[row] = position.take_profit or np.nan
+        
     def add_strategy(self, symbol: str, strategy: IStrategy) -> None:
         """Add strategy for a symbol."""
         self.strategies[symbol] = strategy
@@ -96,6 +116,9 @@ class TradingController(QObject):
             for symbol in self.symbols:
                 if symbol in self.strategies:
                     self._process_symbol(symbol)
+            
+            # One snapshot per cycle instead of a signal per changed value
+            self.signal_tick_snapshot.emit({'positions': self.positions_view()})
                     
         except Exception as e:
             self.signal_error_occurred.emit(f"Trading cycle error: {str(e)}")
@@ -209,6 +232,7 @@ class TradingController(QObject):
                 self.trade_manager.positions[symbol] = position
                 
                 self.current_positions[symbol] = position
+                self._positions_view = None
                 self.portfolio.add_position(position)
                 
                 self.signal_trade_executed.emit({
@@ -303,6 +327,7 @@ class TradingController(QObject):
             
             # Remove position
             del self.current_positions[symbol]
+            self._positions_view = None
             self.portfolio.remove_position(symbol)
             
             # Update broker
@@ -339,6 +364,8 @@ class TradingController(QObject):
                     position.unrealized_pnl = position.side * position.quantity * (
                         position.current_price - position.entry_price
                     )
+                    # Prices and trailing/breakeven stops change in place; the view keeps its rows
+                    self._update_view_row(symbol, position)
                     
             # Update portfolio equity
             self.portfolio.update_equity(self.broker.get_balance())
@@ -400,6 +427,7 @@ class TradingController(QObject):
                 )
                 
                 self.current_positions[symbol] = position
+                self._positions_view = None
                 self.portfolio.add_position(position)
                 
                 action = "LONG" if side > 0 else "SHORT"
@@ -19,6 +19,9 @@ class LanguageManager(QObject):
         self.settings_manager = settings_manager
         self.current_language = "en"
         self.translations = {}
+        self.version = 0  # bumped whenever the translation tables are (re)loaded
+        # Flattened key -> text mapping for current_language, English entries as fallback
+        self._active = {}
         self.languages_dir = Path(__file__).parent.parent / "languages"
         self.languages_dir.mkdir(exist_ok=True)
         
@@ -51,6 +54,14 @@ class LanguageManager(QObject):
         """Load translation files."""
         for lang_code in self.get_supported_languages().keys():
             self.translations[lang_code] = self._load_language_file(lang_code)
+        self.version += 1
+        self._build_active()
+    
+    def _build_active(self):
+        """Snapshot the current language's translations over the English ones for O(1) lookups."""
+        active = dict(self.translations.get("en", {}))
+        active.update(self.translations.get(self.current_language, {}))
+        self._active = active
     
     def _load_language_file(self, lang_code: str) -> Dict[str, str]:
         """Load translation file for specific language."""
@@ -70,32 +81,17 @@ class LanguageManager(QObject):
         """Set the current language."""
         if lang_code in self.get_supported_languages():
             self.current_language = lang_code
+            self._build_active()
             if self.settings_manager:
                 self.settings_manager.set('language', lang_code)
             self.language_changed.emit(lang_code)
     
     def get_text(self, key: str, default: str = None) -> str:
         """Get translated text for a key."""
-        if default is None:
-            default = key
-        
-        # Try current language first
-        if self.current_language in self.translations:
-            text = self.translations[self.current_language].get(key, default)
-            if text != default:
-                return text
-        
-        # Fallback to English
-        if self.current_language != "en" and "en" in self.translations:
-            text = self.translations["en"].get(key, default)
-            if text != default:
-                return text
-        
-        return default
+        return self._active.get(key, key if default is None else default)
     
-    def tr(self, key: str, default: str = None) -> str:
-        """Shortcut for get_text method."""
-        return self.get_text(key, default)
+    # Shortcut for get_text, bound directly so each lookup is a single call
+    tr = get_text
     
     def create_default_translations(self):
         """Create default translation files for all supported languages."""
@@ -5,6 +5,8 @@ import platform
 import subprocess
 import requests
 import json
+import queue
+import threading
 from typing import Optional, Dict, Any
 from datetime import datetime
 from PyQt6.QtWidgets import QApplication
@@ -23,6 +25,10 @@ class NotificationService(QObject):
         self.telegram_config = self._load_telegram_config()
         self.discord_config = self._load_discord_config()
         
+        # Alerts are delivered by a daemon thread so toasts and webhooks never block the caller
+        self._alert_queue = queue.Queue(maxsize=1024)
+        self._alert_thread = None
+        
     def _load_telegram_config(self) -> Dict[str, Any]:
         """Load Telegram configuration from settings."""
         if not self.settings_manager:
@@ -48,6 +54,33 @@ class NotificationService(QObject):
                            entry_price: float, exit_price: float = None, 
                            pnl: float = None, stop_loss: float = None, 
                            take_profit: float = None):
+        """Queue a system alert for position open/close without blocking."""
+        alert = (position_type, symbol, side, entry_price, exit_price, pnl, stop_loss, take_profit)
+        try:
+            self._alert_queue.put_nowait(alert)
+        except queue.Full:
+            # Drop the oldest pending alert rather than block the trading path
+            try:
+                self._alert_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._alert_queue.put_nowait(alert)
+        
+        if self._alert_thread is None:
+            self._alert_thread = threading.Thread(
+                target=self._alert_loop, name="NotificationService", daemon=True)
+            self._alert_thread.start()
+    
+    def _alert_loop(self):
+        """Deliver queued position alerts one at a time."""
+        while True:
+            alert = self._alert_queue.get()
+            self._deliver_position_alert(*alert)
+    
+    def _deliver_position_alert(self, position_type: str, symbol: str, side: str,
+                                entry_price: float, exit_price: float = None,
+                                pnl: float = None, stop_loss: float = None,
+                                take_profit: float = None):
         """Show system alert for position open/close."""
         try:
             # Temporarily disable notifications to prevent crashes
@@ -4,6 +4,7 @@ import json
 import os
 import sqlite3
 import logging
+import threading
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from pathlib import Path
@@ -23,6 +24,10 @@ class SettingsManager:
         self.settings_file = self.config_dir / "settings.json"
         self._settings = self._load_settings()
         
+        # Serialises saves from the GUI and background threads; _dirty tracks unsaved changes
+        self._lock = threading.RLock()
+        self._dirty = not self.settings_file.exists()
+        
     def _load_settings(self) -> Dict[str, Any]:
         """Load settings from file, with environment variable fallback."""
         # Load environment variables as fallback
@@ -54,7 +59,7 @@ class SettingsManager:
         
         if self.settings_file.exists():
             try:
-                with open(self.settings_file, 'r') as f:
+                with open(self.settings_file, 'r', encoding='utf-8') as f:
                     loaded = json.load(f)
                     # Merge with defaults to handle new settings
                     # Settings file values override env var defaults
@@ -74,26 +79,51 @@ class SettingsManager:
         return default_settings
         
     def get(self, key: str, default: Any = None) -> Any:
-        """Get setting value."""
+        """Get setting value from memory; settings.json is only read once, at construction."""
         return self._settings.get(key, default)
         
     def set(self, key: str, value: Any) -> None:
         """Set setting value."""
-        self._settings[key] = value
+        with self._lock:
+            if key not in self._settings or self._settings[key] != value:
+                self._settings[key] = value
+                self._dirty = True
         
     def save(self) -> bool:
-        """Save settings to file."""
-        try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self._settings, f, indent=2)
-            return True
-        except Exception:
-            return False
+        """Save settings to file, skipping the write when nothing changed since the last save."""
+        with self._lock:
+            if not self._dirty:
+                return True
+            tmp_file = self.settings_file.with_suffix('.json.tmp')
+            try:
+                # Write a temporary file and swap it in so a crash never leaves a truncated file
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._settings, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.settings_file)
+                self._dirty = False
+                return True
+            except Exception:
+                # Leave the previous settings.json in place and drop the partial copy
+                try:
+                    tmp_file.unlink()
+                except OSError:
+                    pass
+                return False
+    
+    def save_async(self) -> threading.Thread:
+        """Save settings on a background thread; join the returned thread to wait for it."""
+        thread = threading.Thread(target=self.save, name="SettingsSave", daemon=True)
+        thread.start()
+        return thread
             
     def reset_to_defaults(self) -> None:
         """Reset all settings to defaults."""
-        self._settings = self._load_settings()
-        self.save()
+        with self._lock:
+            self._settings = self._load_settings()
+            self._dirty = True
+            self.save()
 
 
 class DatabaseManager:
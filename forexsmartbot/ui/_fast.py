@@ -0,0 +1,43 @@
+"""Compiled numeric kernels for the UI refresh paths."""
+
+import numpy as np
+
+# numba is optional here; fall back to NumPy/plain Python when it is not installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: unset SL/TP are NaN and must keep comparing False
+    @njit(cache=True)
+    def compute_row_state(sides, qty, entry, cur, sl, tp, out_pnl, out_sl_hit, out_tp_hit):
+        """Fill PnL and SL/TP hit flags for the first len(sides) rows of the out arrays."""
+        for i in range(sides.shape[0]):
+            out_pnl[i] = sides[i] * (qty[i] / 1000.0) * 10.0 * (cur[i] - entry[i])
+            out_sl_hit[i] = (sides[i] > 0 and cur[i] <= sl[i]) or (sides[i] < 0 and cur[i] >= sl[i])
+            out_tp_hit[i] = (sides[i] > 0 and cur[i] >= tp[i]) or (sides[i] < 0 and cur[i] <= tp[i])
+else:
+    def compute_row_state(sides, qty, entry, cur, sl, tp, out_pnl, out_sl_hit, out_tp_hit):
+        """Fill PnL and SL/TP hit flags for the first len(sides) rows of the out arrays."""
+        n = sides.shape[0]
+        long_, short = sides > 0, sides < 0
+        out_pnl[:n] = sides * (qty / 1000.0) * 10.0 * (cur - entry)
+        # For Long: SL hit below the stop, TP hit above the target; reversed for Short
+        out_sl_hit[:n] = (long_ & (cur <= sl)) | (short & (cur >= sl))
+        out_tp_hit[:n] = (long_ & (cur >= tp)) | (short & (cur <= tp))
+
+
+def warm_up():
+    """Compile compute_row_state once so the first refresh does not pay the JIT cost."""
+    one = np.ones(1)
+    compute_row_state(np.ones(1, dtype=np.int8), one, one, one, one, one,
+                      np.empty(1), np.empty(1, dtype=np.bool_), np.empty(1, dtype=np.bool_))
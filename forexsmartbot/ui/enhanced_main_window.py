@@ -5,201 +5,451 @@ Updated with all new features and improved UI/UX
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QLineEdit, QPushButton, QComboBox, QDoubleSpinBox,
-    QTextEdit, QTableWidget, QTableWidgetItem, QHeaderView,
-    QGroupBox, QFormLayout, QCheckBox, QMessageBox, QStatusBar,
-    QProgressBar, QSplitter, QDialog, QFrame, QScrollArea,
-    QSpinBox, QSlider, QToolBar, QMenuBar, QMenu, QListWidget,
-    QListWidgetItem, QAbstractItemView, QApplication, QTabWidget
+    QLabel, QPushButton, QComboBox, QPlainTextEdit, QTableView, QHeaderView,
+    QGroupBox, QFormLayout, QMessageBox, QStatusBar, QDialog, QListWidget,
+    QListWidgetItem, QAbstractItemView, QApplication, QTabWidget, QProgressDialog
 )
-from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QThread, QMutex
-from PyQt6.QtGui import QFont, QPixmap, QIcon, QAction, QPalette, QColor
+from PyQt6.QtCore import (
+    QTimer, Qt, QEvent, pyqtSignal, QObject, QRunnable, QThreadPool,
+    QAbstractTableModel, QModelIndex
+)
+from PyQt6.QtGui import QAction, QColor, QBrush, QIcon, QPainter, QPixmap
+from PyQt6 import sip
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-import logging
+from typing import Dict, List, Optional
+import functools
+from time import monotonic
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import os
+import re
+import threading
 
-from ..core.interfaces import IBroker, IStrategy, IDataProvider, Position, Trade
+from ..core.interfaces import PositionArray, Trade
 from ..core.portfolio import Portfolio
 from ..core.risk_engine import RiskEngine, RiskConfig
 from ..services.controller import TradingController
 from ..services.persistence import SettingsManager, DatabaseManager, LogManager
-from ..strategies import get_strategy, list_strategies
+from ..strategies import get_strategy, STRATEGIES, RISK_LEVELS
 from ..adapters.brokers import PaperBroker, MT4Broker, RestBroker, IBTWSBroker
-from ..adapters.data import YFinanceProvider, CSVProvider, MultiProvider, AlphaVantageProvider, OANDAProvider
-from .settings_dialog import SettingsDialog
+from ..adapters.data import MultiProvider
+from .settings_dialog import SettingsDialog, FEATURE_TABS
 from .backtest_dialog import BacktestDialog
 from .export_dialog import ExportDialog
 from .theme import ThemeManager
 from ..services.notification_service import NotificationService
 from ..services.startup_manager import StartupManager
 from ..services.language_manager import LanguageManager
+from ._fast import njit, compute_row_state, warm_up as _warm_up_kernels
 
 
-class TradingStatusWidget(QWidget):
-    """Widget showing trading status with real-time updates."""
+# Force verbose sizing/PnL/trade-count diagnostics on regardless of the debug_logging setting
+DEBUG_TRADES = os.getenv('FSB_DEBUG', '').lower() in ('1', 'true', 'yes')
+
+# Environment endpoints read by the window, with their defaults
+_ENV_DEFAULTS = (
+    ('REMOTE_MONITOR_HOST', '127.0.0.1'),
+    ('REMOTE_MONITOR_PORT', '8080'),
+    ('API_HOST', '127.0.0.1'),
+    ('API_PORT', '5000'),
+    ('MT4_ZMQ_HOST', '127.0.0.1'),
+    ('MT4_ZMQ_PORT', '5555'),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """Endpoint environment values; .env is parsed once per process."""
+    from dotenv import load_dotenv
+    load_dotenv(override=False)
+    return {key: os.getenv(key, default) for key, default in _ENV_DEFAULTS}
+
+# Indicator columns each strategy must produce before its signal() can be trusted
+_REQUIRED_INDICATORS = {
+    'ML Adaptive SuperTrend': frozenset({'SuperTrend', 'Direction'}),
+    'Adaptive Trend Flow': frozenset({'Trend_Flow', 'Signal_Strength'}),
+    'SMA Crossover': frozenset({'SMA_fast', 'SMA_slow'}),
+    'Breakout ATR': frozenset({'ATR', 'Breakout_High', 'Breakout_Low'}),
+    'RSI Reversion': frozenset({'RSI', 'ATR'}),
+    'Scalping MA': frozenset({'EMA_Fast', 'EMA_Medium', 'EMA_Slow'}),
+    'News Trading': frozenset({'Volatility', 'ATR', 'Breakout_High'}),
+    'Momentum Breakout': frozenset({'Momentum', 'ATR', 'Breakout_High'}),
+    'Mean Reversion': frozenset({'RSI', 'ATR', 'BB_Upper'}),
+}
+
+# Strategy risk buckets, frozen once at import; ML strategies always count as high risk
+_ML_STRATEGIES = ('LSTM_Strategy', 'SVM_Strategy', 'Ensemble_ML_Strategy',
+                  'Transformer_Strategy', 'RL_Strategy', 'Multi_Timeframe')
+_LOW_RISK = tuple(RISK_LEVELS.get('Low_Risk', ()))
+_MEDIUM_RISK = tuple(RISK_LEVELS.get('Medium_Risk', ()))
+_HIGH_RISK = tuple(RISK_LEVELS.get('High_Risk', ())) + tuple(
+    name for name in _ML_STRATEGIES if name in STRATEGIES and name not in RISK_LEVELS.get('High_Risk', ()))
+_CATEGORIZED = frozenset(_LOW_RISK + _MEDIUM_RISK + _HIGH_RISK)
+
+# Forex pairs offered for trading, ordered by trading quality
+# Major pairs (highest liquidity, best for trading)
+_MAJOR_PAIRS = ("EURUSD", "GBPUSD", "USDJPY", "AUDUSD", "USDCAD", "USDCHF", "NZDUSD")
+# Minor pairs (good liquidity, active trading)
+_MINOR_PAIRS = ("EURGBP", "EURJPY", "GBPJPY", "AUDCAD", "AUDCHF", "AUDJPY", "AUDNZD", "CADCHF", "CADJPY", "CHFJPY", "EURAUD", "EURCAD", "EURCHF", "EURNZD", "GBPAUD", "GBPCAD", "GBPCHF", "GBPNZD", "NZDCAD", "NZDCHF", "NZDJPY")
+# Exotic pairs (higher volatility, more opportunities)
+_EXOTIC_PAIRS = ("USDTRY", "USDZAR", "USDMXN", "USDPLN", "USDCZK", "USDHUF", "USDSEK", "USDNOK", "USDDKK", "USDRUB", "USDCNH", "USDSGD", "USDHKD", "USDTWD", "USDKRW", "USDINR", "USDBRL", "USDARS", "USDCLP", "USDCOP")
+_ALL_PAIRS = _MAJOR_PAIRS + _MINOR_PAIRS + _EXOTIC_PAIRS
+_MAJOR_SET = frozenset(_MAJOR_PAIRS)
+_MINOR_SET = frozenset(_MINOR_PAIRS)
+# Pre-selected best trading pairs
+_BEST_PAIRS = frozenset({"GBPUSD", "GBPJPY", "EURUSD", "CADJPY", "USDCHF", "AUDNZD"})
+
+# Status label colour stylesheets, reused instead of formatting a new string per tick
+_QSS_GREEN = "color: green;"
+_QSS_RED = "color: red;"
+_QSS_BLUE = "color: blue;"
+_QSS_ORANGE = "color: orange;"
+_QSS_ACTIVE = "color: green; font-weight: bold;"
+_QSS_INACTIVE = "color: gray; font-weight: bold;"
+_QSS_BOLD_RED = "color: red; font-weight: bold;"
+_QSS_BOLD_BLUE = "color: blue; font-weight: bold;"
+_QSS_BOLD_ORANGE = "color: orange; font-weight: bold;"
+_QSS_BOLD_PURPLE = "color: purple; font-weight: bold;"
+
+# Broker status label colour per broker mode; unknown modes are shown in gray
+_BROKER_QSS = {
+    "PAPER": _QSS_BOLD_BLUE,
+    "MT4": _QSS_BOLD_ORANGE,
+    "REST API": _QSS_ACTIVE,
+    "IB TWS": _QSS_BOLD_PURPLE,
+}
+
+# Connect/start button captions that reflect live state and are left untranslated
+_STATE_BUTTON_TEXTS = frozenset({"Connect", "Disconnect", "Start Trading", "Stop Trading"})
+
+# Pixel widths of the positions table columns (symbol, side, then three prices)
+_POSITION_COLUMN_WIDTHS = (80, 60, 90, 90, 90)
+
+# Button stylesheets, parsed once per widget state change rather than rebuilt from literals
+_BTN_GREEN_CSS = "QPushButton { background-color: #4CAF50; color: white; font-weight: bold; padding: 8px; }"
+_BTN_RED_CSS = "QPushButton { background-color: #f44336; color: white; font-weight: bold; padding: 8px; }"
+_BTN_BLUE_CSS = "QPushButton { background-color: #2196F3; color: white; font-weight: bold; padding: 8px; }"
+
+# Item foreground brushes shared by the tables and the symbol list
+_BRUSH_RED = QBrush(QColor("red"))
+_BRUSH_GREEN = QBrush(QColor("green"))
+_BRUSH_BLUE = QBrush(QColor("blue"))
+_BRUSH_ORANGE = QBrush(QColor("orange"))
+_BRUSH_DEFAULT = QBrush()
+
+# About dialog body, built once at import
+_ABOUT_TEXT = (
+    "ForexSmartBot v3.3.0\n\n"
+    "Advanced Trading Platform with Machine Learning Strategies\n\n"
+    "Features:\n"
+    "• Real-time trading\n"
+    "• 17+ Trading Strategies (including 7 ML strategies)\n"
+    "• Strategy Optimization Tools\n"
+    "• Visual Strategy Builder\n"
+    "• Strategy Marketplace\n"
+    "• Advanced Analytics\n"
+    "• Cloud Integration\n"
+    "• Remote Monitoring\n"
+    "• Risk management\n"
+    "• Backtesting\n\n"
+    "© 2026 VoxHash Technologies"
+)
+
+
+# Leverage ratio in combo text such as "1:10 (Moderate)"
+_LEV_RE = re.compile(r"1:(\d+(?:\.\d+)?)")
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_leverage(text):
+    """Leverage multiplier from a leverage combo label, or 1.0 if none is present."""
+    m = _LEV_RE.search(text)
+    return float(m.group(1)) if m else 1.0
+
+
+@njit(cache=True)
+def _size_kernel(balance, base_risk_pct, leverage, min_amt, max_amt):
+    """Conservative position size in units for the given balance and risk settings."""
+    # Risk-based size: 1 micro lot (1,000 units) per $100 of leveraged risk, leverage capped at 3x
+    risk_amount = balance * base_risk_pct
+    leveraged_risk = risk_amount * min(leverage, 3.0)
+    units = max(1, int(leveraged_risk / 100.0)) * 1000
+    # Respect the user's max trade amount and never exceed 50 units
+    units = min(units, int(max_amt), 50)
+    # Apply minimum trade amount, then the 1,000 unit (1 micro lot) safety cap
+    units = max(int(min_amt), units)
+    return min(units, 1000)
+
+
+class WorkerSignals(QObject):
+    """Signals used by BrokerWorker to hand results back to the GUI thread."""
+    
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class BrokerWorker(QRunnable):
+    """Runs a blocking broker/data-provider call on a thread pool."""
+    
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+class SignalWorkerSignals(QObject):
+    """Signals used by SignalWorker to hand a strategy signal back to the GUI thread."""
+    
+    signal_ready = pyqtSignal(str, int, float, int)  # symbol, signal, price, trade epoch
+    error = pyqtSignal(str, str)  # symbol, error message
+
+
+class SignalWorker(QRunnable):
+    """Fetches the price and evaluates the strategy for one symbol on a thread pool."""
+    
+    def __init__(self, fn, strategy, symbol, data_interval, epoch):
+        super().__init__()
+        self.fn = fn
+        self.strategy = strategy
+        self.symbol = symbol
+        self.data_interval = data_interval
+        self.epoch = epoch
+        self.signals = SignalWorkerSignals()
+        
+    def run(self):
+        try:
+            signal, price = self.fn(self.strategy, self.symbol, self.data_interval, self.epoch)
+        except Exception as e:
+            self.signals.error.emit(self.symbol, str(e))
+        else:
+            if price is not None:
+                self.signals.signal_ready.emit(self.symbol, int(signal), float(price), self.epoch)
+
+
+class _TranslatableWidget(QWidget):
+    """Panel that retranslates itself whenever its language manager switches language."""
+    
+    FRAME_MS = 16  # Coalesce real-time refreshes to roughly one per 60 Hz frame
+    _TR_GROUP = None  # (key, default) of the group box title
+    _TR_HEADERS = ()  # (key, default) of each table column
     
     def __init__(self, parent=None, language_manager=None):
         super().__init__(parent)
         self.language_manager = language_manager
-        self.setup_ui()
+        self._group_box = None
+        self._header_model = None
+        self._headers_by_lang = {}
+        self._tr_labels = {}
+        self._tr_values = {}
+        self._pending_text = {}
+        self._text_timer = None
+        self._snapshot = {}
+        if language_manager is not None:
+            language_manager.language_changed.connect(self._on_language_changed)
     
     def tr(self, key, default=None):
         """Get translated text."""
         if self.language_manager:
             return self.language_manager.tr(key, default)
         return default or key
-        
+    
+    def _on_language_changed(self, lang_code):
+        """Re-apply translated text for the new language."""
+        self.update_language(self.language_manager)
+    
+    def update_language(self, language_manager):
+        """Update widget text based on current language."""
+        try:
+            self._retranslate(language_manager)
+        except Exception as e:
+            print(f"Error updating {type(self).__name__} language: {e}")
+    
+    def apply_snapshot(self, values):
+        """Single entry point for a tick: queue only the label texts that changed since the last snapshot."""
+        last = self._snapshot
+        for name, text in values.items():
+            if last.get(name) != text:
+                last[name] = text
+                self.queue_text(getattr(self, name), text)
+    
+    def queue_text(self, label, text):
+        """Set a label's text on the next frame, coalescing updates that arrive in between."""
+        self._pending_text[label] = text
+        if self._text_timer is None:
+            self._text_timer = QTimer(self)
+            self._text_timer.setSingleShot(True)
+            self._text_timer.setInterval(self.FRAME_MS)
+            self._text_timer.timeout.connect(self._flush_text)
+        if not self._text_timer.isActive():
+            self._text_timer.start()
+    
+    def _flush_text(self):
+        """Apply the latest queued text of every label."""
+        pending, self._pending_text = self._pending_text, {}
+        for label, text in pending.items():
+            if label.text() != text:
+                label.setText(text)
+    
+    def _caption(self, key, default):
+        """Create a caption label and remember it for retranslation."""
+        label = QLabel(f"{self.tr(key, default)}:")
+        self._tr_labels[key] = (label, default)
+        return label
+    
+    def _track_value(self, key, label):
+        """Remember a status label whose idle text is the translation of key."""
+        self._tr_values[key] = [label, label.text()]
+    
+    def _make_group_box(self):
+        """Create the panel's group box with its translated title, kept for retranslation."""
+        self._group_box = QGroupBox(self.tr(*self._TR_GROUP))
+        return self._group_box
+    
+    def _header_texts(self, language_manager=None):
+        """Translated table column headers, built once per (language, table version)."""
+        language_manager = language_manager or self.language_manager
+        if language_manager is None:
+            return [default for _, default in self._TR_HEADERS]
+        lang = (language_manager.current_language, language_manager.version)
+        headers = self._headers_by_lang.get(lang)
+        if headers is None:
+            tr = language_manager.tr
+            headers = self._headers_by_lang[lang] = [tr(key, default) for key, default in self._TR_HEADERS]
+        return headers
+    
+    def _retranslate(self, language_manager):
+        """Apply translations to the group box, table headers and remembered labels."""
+        if self._group_box is not None:
+            self._group_box.setTitle(language_manager.tr(*self._TR_GROUP))
+        if self._header_model is not None:
+            self._header_model.set_headers(self._header_texts(language_manager))
+        for key, (label, default) in self._tr_labels.items():
+            label.setText(f"{language_manager.tr(key, default)}:")
+        # Status values are only retranslated while they still show their
+        # idle text; live values set elsewhere are left untouched.
+        for key, entry in self._tr_values.items():
+            label, shown = entry
+            if label.text() == shown:
+                entry[1] = language_manager.tr(key, shown)
+                label.setText(entry[1])
+
+
+class TradingStatusWidget(_TranslatableWidget):
+    """Widget showing trading status with real-time updates."""
+    
+    _TR_GROUP = ("trading_status", "Trading Status")
+    
+    def __init__(self, parent=None, language_manager=None):
+        super().__init__(parent, language_manager)
+        self.setup_ui()
+    
     def setup_ui(self):
         layout = QVBoxLayout(self)
         
         # Status indicators
-        status_group = QGroupBox(self.tr("trading_status", "Trading Status"))
+        status_group = self._make_group_box()
         status_layout = QGridLayout(status_group)
         
         # Broker status
         self.broker_status = QLabel(self.tr("paper", "PAPER"))
-        self.broker_status.setStyleSheet("color: blue; font-weight: bold;")
-        status_layout.addWidget(QLabel(f"{self.tr('broker', 'Broker')}:"), 0, 0)
+        self.broker_status.setStyleSheet(_QSS_BOLD_BLUE)
+        status_layout.addWidget(self._caption("broker", "Broker"), 0, 0)
         status_layout.addWidget(self.broker_status, 0, 1)
+        self._track_value("paper", self.broker_status)
         
         # Connection status
         self.connection_status = QLabel(self.tr("disconnected", "Disconnected"))
-        self.connection_status.setStyleSheet("color: red; font-weight: bold;")
-        status_layout.addWidget(QLabel(f"{self.tr('connection', 'Connection')}:"), 1, 0)
+        self.connection_status.setStyleSheet(_QSS_BOLD_RED)
+        status_layout.addWidget(self._caption("connection", "Connection"), 1, 0)
         status_layout.addWidget(self.connection_status, 1, 1)
+        self._track_value("disconnected", self.connection_status)
         
         # Trading status
         self.trading_status = QLabel(self.tr("stopped", "Stopped"))
-        self.trading_status.setStyleSheet("color: orange; font-weight: bold;")
-        status_layout.addWidget(QLabel(f"{self.tr('trading', 'Trading')}:"), 2, 0)
+        self.trading_status.setStyleSheet(_QSS_BOLD_ORANGE)
+        status_layout.addWidget(self._caption("trading", "Trading"), 2, 0)
         status_layout.addWidget(self.trading_status, 2, 1)
+        self._track_value("stopped", self.trading_status)
         
         # Balance (real-time)
         self.balance_label = QLabel("$0.00")
         self.balance_label.setStyleSheet("color: green; font-weight: bold; font-size: 14px;")
-        status_layout.addWidget(QLabel(f"{self.tr('balance', 'Balance')}:"), 3, 0)
+        status_layout.addWidget(self._caption("balance", "Balance"), 3, 0)
         status_layout.addWidget(self.balance_label, 3, 1)
         
         # Equity (real-time)
         self.equity_label = QLabel("$0.00")
         self.equity_label.setStyleSheet("color: blue; font-weight: bold; font-size: 14px;")
-        status_layout.addWidget(QLabel(f"{self.tr('equity', 'Equity')}:"), 4, 0)
+        status_layout.addWidget(self._caption("equity", "Equity"), 4, 0)
         status_layout.addWidget(self.equity_label, 4, 1)
         
         # Drawdown (real-time)
         self.drawdown_label = QLabel("0.0%")
-        self.drawdown_label.setStyleSheet("color: red; font-weight: bold;")
-        status_layout.addWidget(QLabel(f"{self.tr('drawdown', 'Drawdown')}:"), 5, 0)
+        self.drawdown_label.setStyleSheet(_QSS_BOLD_RED)
+        status_layout.addWidget(self._caption("drawdown", "Drawdown"), 5, 0)
         status_layout.addWidget(self.drawdown_label, 5, 1)
         
         # Monitoring status (real-time)
         self.monitoring_status = QLabel(self.tr("inactive", "Inactive"))
-        self.monitoring_status.setStyleSheet("color: gray; font-weight: bold;")
-        status_layout.addWidget(QLabel(f"{self.tr('monitoring', 'Monitoring')}:"), 6, 0)
+        self.monitoring_status.setStyleSheet(_QSS_INACTIVE)
+        status_layout.addWidget(self._caption("monitoring", "Monitoring"), 6, 0)
         status_layout.addWidget(self.monitoring_status, 6, 1)
+        self._track_value("inactive", self.monitoring_status)
         
         layout.addWidget(status_group)
-    
-    def update_language(self, language_manager):
-        """Update widget text based on current language."""
-        try:
-            # Update group box title
-            status_group = self.findChild(QGroupBox)
-            if status_group:
-                status_group.setTitle(language_manager.tr("trading_status", "Trading Status"))
-            
-            # Update labels
-            labels = self.findChildren(QLabel)
-            for label in labels:
-                text = label.text()
-                if text == "Broker:":
-                    label.setText(language_manager.tr("broker", "Broker:"))
-                elif text == "Connection:":
-                    label.setText(language_manager.tr("connection", "Connection:"))
-                elif text == "Trading:":
-                    label.setText(language_manager.tr("trading", "Trading:"))
-                elif text == "Balance:":
-                    label.setText(language_manager.tr("balance", "Balance:"))
-                elif text == "Equity:":
-                    label.setText(language_manager.tr("equity", "Equity:"))
-                elif text == "Drawdown:":
-                    label.setText(language_manager.tr("drawdown", "Drawdown:"))
-                elif text == "Monitoring:":
-                    label.setText(language_manager.tr("monitoring", "Monitoring:"))
-                # Update status values
-                elif text == "PAPER":
-                    label.setText(language_manager.tr("paper", "PAPER"))
-                elif text == "Disconnected":
-                    label.setText(language_manager.tr("disconnected", "Disconnected"))
-                elif text == "Stopped":
-                    label.setText(language_manager.tr("stopped", "Stopped"))
-                elif text == "Inactive":
-                    label.setText(language_manager.tr("inactive", "Inactive"))
-        except Exception as e:
-            print(f"Error updating TradingStatusWidget language: {e}")
 
 
-class StrategyConfigWidget(QWidget):
+class StrategyConfigWidget(_TranslatableWidget):
     """Widget for strategy configuration with multi-symbol selection."""
     
+    _TR_GROUP = ("strategy_config", "Strategy Configuration")
+    
     def __init__(self, parent=None, language_manager=None):
-        super().__init__(parent)
-        self.language_manager = language_manager
+        super().__init__(parent, language_manager)
+        self._populated = False
         self.setup_ui()
     
-    def tr(self, key, default=None):
-        """Get translated text."""
-        if self.language_manager:
-            return self.language_manager.tr(key, default)
-        return default or key
-        
     def setup_ui(self):
         layout = QVBoxLayout(self)
         
         # Strategy Configuration
-        strategy_group = QGroupBox(self.tr("strategy_config", "Strategy Configuration"))
+        strategy_group = self._make_group_box()
         strategy_layout = QFormLayout(strategy_group)
         
         # Strategy selection - Load all strategies dynamically from module
         self.strategy_combo = QComboBox()
         
-        # Get all available strategies from the strategies module
-        from ..strategies import STRATEGIES, RISK_LEVELS
-        
-        # Organize strategies by risk level
-        low_risk_strategies = RISK_LEVELS.get('Low_Risk', [])
-        medium_risk_strategies = RISK_LEVELS.get('Medium_Risk', [])
-        high_risk_strategies = RISK_LEVELS.get('High_Risk', [])
-        
-        # Get all strategies and categorize them
-        all_strategies = list(STRATEGIES.keys())
-        
-        # Add ML strategies to appropriate risk levels
-        ml_strategies = ['LSTM_Strategy', 'SVM_Strategy', 'Ensemble_ML_Strategy', 
-                        'Transformer_Strategy', 'RL_Strategy', 'Multi_Timeframe']
-        for ml_strategy in ml_strategies:
-            if ml_strategy in all_strategies and ml_strategy not in high_risk_strategies:
-                high_risk_strategies.append(ml_strategy)
-        
         # Add strategies with risk level indicators
-        for strategy in low_risk_strategies:
-            if strategy in all_strategies:
-                self.strategy_combo.addItem(f"🟢 {strategy} ({self.tr('low_risk', 'Low Risk')})")
-        for strategy in medium_risk_strategies:
-            if strategy in all_strategies:
-                self.strategy_combo.addItem(f"🟡 {strategy} ({self.tr('medium_risk', 'Medium Risk')})")
-        for strategy in high_risk_strategies:
-            if strategy in all_strategies:
-                self.strategy_combo.addItem(f"🔴 {strategy} ({self.tr('high_risk', 'High Risk')})")
+        low, medium, high = self.tr('low_risk', 'Low Risk'), self.tr('medium_risk', 'Medium Risk'), self.tr('high_risk', 'High Risk')
+        # Risk is marked by a coloured dot icon rather than an emoji in the item text
+        for strategy in _LOW_RISK:
+            if strategy in STRATEGIES:
+                self.strategy_combo.addItem(_risk_icon("green"), f"{strategy} ({low})")
+        for strategy in _MEDIUM_RISK:
+            if strategy in STRATEGIES:
+                self.strategy_combo.addItem(_risk_icon("gold"), f"{strategy} ({medium})")
+        for strategy in _HIGH_RISK:
+            if strategy in STRATEGIES:
+                self.strategy_combo.addItem(_risk_icon("red"), f"{strategy} ({high})")
         
         # Add any remaining strategies that weren't categorized
-        for strategy in all_strategies:
-            if strategy not in low_risk_strategies + medium_risk_strategies + high_risk_strategies:
-                self.strategy_combo.addItem(f"⚪ {strategy}")
+        for strategy in STRATEGIES:
+            if strategy not in _CATEGORIZED:
+                self.strategy_combo.addItem(_risk_icon("lightgray"), strategy)
             
-        strategy_layout.addRow(f"{self.tr('strategy', 'Strategy')}:", self.strategy_combo)
+        strategy_layout.addRow(self._caption("strategy", "Strategy"), self.strategy_combo)
         
         # Multi-symbol selection
         symbols_group = QWidget()
@@ -209,37 +459,9 @@ class StrategyConfigWidget(QWidget):
         self.symbols_list.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
         self.symbols_list.setMaximumHeight(100)
         
-        # Add forex pairs organized by trading quality
-        # Major pairs (highest liquidity, best for trading)
-        major_pairs = ["EURUSD", "GBPUSD", "USDJPY", "AUDUSD", "USDCAD", "USDCHF", "NZDUSD"]
-        # Minor pairs (good liquidity, active trading)
-        minor_pairs = ["EURGBP", "EURJPY", "GBPJPY", "AUDCAD", "AUDCHF", "AUDJPY", "AUDNZD", "CADCHF", "CADJPY", "CHFJPY", "EURAUD", "EURCAD", "EURCHF", "EURNZD", "GBPAUD", "GBPCAD", "GBPCHF", "GBPNZD", "NZDCAD", "NZDCHF", "NZDJPY"]
-        # Exotic pairs (higher volatility, more opportunities)
-        exotic_pairs = ["USDTRY", "USDZAR", "USDMXN", "USDPLN", "USDCZK", "USDHUF", "USDSEK", "USDNOK", "USDDKK", "USDRUB", "USDCNH", "USDSGD", "USDHKD", "USDTWD", "USDKRW", "USDINR", "USDBRL", "USDARS", "USDCLP", "USDCOP"]
-        
-        # Combine all pairs in order of trading quality
-        all_pairs = major_pairs + minor_pairs + exotic_pairs
-        
-        for pair in all_pairs:
-            item = QListWidgetItem(pair)
-            # Color code by category
-            if pair in major_pairs:
-                item.setForeground(QColor("green"))  # Major pairs in green
-            elif pair in minor_pairs:
-                item.setForeground(QColor("blue"))   # Minor pairs in blue
-            else:
-                item.setForeground(QColor("orange")) # Exotic pairs in orange
-            self.symbols_list.addItem(item)
-        
-        # Pre-select some of the best trading pairs
-        best_pairs = ["GBPUSD", "GBPJPY", "EURUSD", "CADJPY", "USDCHF", "AUDNZD"]
-        for i in range(self.symbols_list.count()):
-            item = self.symbols_list.item(i)
-            if item.text() in best_pairs:
-                item.setSelected(True)
-        
+        # Items are added by _populate_symbols once the widget is first shown
         symbols_layout.addWidget(self.symbols_list)
-        strategy_layout.addRow(f"{self.tr('symbols', 'Symbols')}:", symbols_group)
+        strategy_layout.addRow(self._caption("symbols", "Symbols"), symbols_group)
         
         # Leverage selection
         self.leverage_combo = QComboBox()
@@ -258,141 +480,117 @@ class StrategyConfigWidget(QWidget):
         ]
         self.leverage_combo.addItems(leverage_options)
         self.leverage_combo.setCurrentText(f"1:10 ({self.tr('moderate', 'Moderate')})")
-        strategy_layout.addRow(f"{self.tr('leverage', 'Leverage')}:", self.leverage_combo)
+        strategy_layout.addRow(self._caption("leverage", "Leverage"), self.leverage_combo)
         
         layout.addWidget(strategy_group)
         
+    def showEvent(self, event):
+        """Fill the symbol list on the first show, after the shell has painted."""
+        super().showEvent(event)
+        if not self._populated:
+            QTimer.singleShot(0, self._populate_symbols)
+    
+    def _populate_symbols(self):
+        """Add the forex pairs to the symbol list and pre-select the best ones."""
+        if self._populated:
+            return
+        self._populated = True
+        
+        # Build the list in one pass with repaints and signals suspended
+        self.symbols_list.setUpdatesEnabled(False)
+        self.symbols_list.blockSignals(True)
+        try:
+            for pair in _ALL_PAIRS:
+                item = QListWidgetItem(pair)
+                # Color code by category: major green, minor blue, exotic orange
+                if pair in _MAJOR_SET:
+                    item.setForeground(_BRUSH_GREEN)
+                elif pair in _MINOR_SET:
+                    item.setForeground(_BRUSH_BLUE)
+                else:
+                    item.setForeground(_BRUSH_ORANGE)
+                self.symbols_list.addItem(item)
+                # Selection needs the item to belong to the list, so it follows addItem
+                if pair in _BEST_PAIRS:
+                    item.setSelected(True)
+        finally:
+            self.symbols_list.blockSignals(False)
+            self.symbols_list.setUpdatesEnabled(True)
+    
     def get_selected_symbols(self):
         """Get selected symbols."""
+        self._populate_symbols()
         selected_items = self.symbols_list.selectedItems()
         return [item.text() for item in selected_items] if selected_items else ["EURUSD"]
-    
-    def update_language(self, language_manager):
-        """Update widget text based on current language."""
-        try:
-            # Update group box title
-            strategy_group = self.findChild(QGroupBox)
-            if strategy_group:
-                strategy_group.setTitle(language_manager.tr("strategy_config", "Strategy Configuration"))
-            
-            # Update form labels
-            form_layout = strategy_group.layout()
-            if form_layout:
-                for i in range(form_layout.rowCount()):
-                    label_item = form_layout.itemAt(i, QFormLayout.ItemRole.LabelRole)
-                    if label_item and label_item.widget():
-                        label = label_item.widget()
-                        text = label.text()
-                        if text == "Strategy:":
-                            label.setText(language_manager.tr("strategy", "Strategy:"))
-                        elif text == "Symbols:":
-                            label.setText(language_manager.tr("symbols", "Symbols:"))
-                        elif text == "Leverage:":
-                            label.setText(language_manager.tr("leverage", "Leverage:"))
-        except Exception as e:
-            print(f"Error updating StrategyConfigWidget language: {e}")
 
 
-class PerformanceMetricsWidget(QWidget):
+class PerformanceMetricsWidget(_TranslatableWidget):
     """Widget showing performance metrics with real-time updates."""
     
+    _TR_GROUP = ("performance_metrics", "Performance Metrics")
+    
     def __init__(self, parent=None, language_manager=None):
-        super().__init__(parent)
-        self.language_manager = language_manager
+        super().__init__(parent, language_manager)
         self.setup_ui()
     
-    def tr(self, key, default=None):
-        """Get translated text."""
-        if self.language_manager:
-            return self.language_manager.tr(key, default)
-        return default or key
-        
     def setup_ui(self):
         layout = QVBoxLayout(self)
         
         # Performance metrics
-        metrics_group = QGroupBox(self.tr("performance_metrics", "Performance Metrics"))
+        metrics_group = self._make_group_box()
         metrics_layout = QGridLayout(metrics_group)
         
         # Total Trades (real-time)
         self.total_trades_label = QLabel("0")
         self.total_trades_label.setStyleSheet("font-weight: bold; color: blue;")
-        metrics_layout.addWidget(QLabel(f"{self.tr('total_trades', 'Total Trades')}:"), 0, 0)
+        metrics_layout.addWidget(self._caption("total_trades", "Total Trades"), 0, 0)
         metrics_layout.addWidget(self.total_trades_label, 0, 1)
         
         # Win Rate (real-time)
         self.win_rate_label = QLabel("0%")
         self.win_rate_label.setStyleSheet("font-weight: bold; color: green;")
-        metrics_layout.addWidget(QLabel(f"{self.tr('win_rate', 'Win Rate')}:"), 1, 0)
+        metrics_layout.addWidget(self._caption("win_rate", "Win Rate"), 1, 0)
         metrics_layout.addWidget(self.win_rate_label, 1, 1)
         
         # Profit Factor (real-time)
         self.profit_factor_label = QLabel("0.00")
         self.profit_factor_label.setStyleSheet("font-weight: bold; color: orange;")
-        metrics_layout.addWidget(QLabel(f"{self.tr('profit_factor', 'Profit Factor')}:"), 2, 0)
+        metrics_layout.addWidget(self._caption("profit_factor", "Profit Factor"), 2, 0)
         metrics_layout.addWidget(self.profit_factor_label, 2, 1)
         
         # Max Drawdown (real-time)
         self.max_drawdown_label = QLabel("0%")
         self.max_drawdown_label.setStyleSheet("font-weight: bold; color: red;")
-        metrics_layout.addWidget(QLabel(f"{self.tr('max_drawdown', 'Max Drawdown')}:"), 3, 0)
+        metrics_layout.addWidget(self._caption("max_drawdown", "Max Drawdown"), 3, 0)
         metrics_layout.addWidget(self.max_drawdown_label, 3, 1)
         
         layout.addWidget(metrics_group)
-    
-    def update_language(self, language_manager):
-        """Update widget text based on current language."""
-        try:
-            # Update group box title
-            metrics_group = self.findChild(QGroupBox)
-            if metrics_group:
-                metrics_group.setTitle(language_manager.tr("performance_metrics", "Performance Metrics"))
-            
-            # Update labels
-            labels = self.findChildren(QLabel)
-            for label in labels:
-                text = label.text()
-                if text == "Total Trades:":
-                    label.setText(language_manager.tr("total_trades", "Total Trades:"))
-                elif text == "Win Rate:":
-                    label.setText(language_manager.tr("win_rate", "Win Rate:"))
-                elif text == "Profit Factor:":
-                    label.setText(language_manager.tr("profit_factor", "Profit Factor:"))
-                elif text == "Max Drawdown:":
-                    label.setText(language_manager.tr("max_drawdown", "Max Drawdown:"))
-        except Exception as e:
-            print(f"Error updating PerformanceMetricsWidget language: {e}")
 
 
-class TradingControlsWidget(QWidget):
+class TradingControlsWidget(_TranslatableWidget):
     """Widget for trading controls with proper connect/disconnect and start/stop functionality."""
     
+    _TR_GROUP = ("trading_controls", "Trading Controls")
+    
     def __init__(self, parent=None, language_manager=None):
-        super().__init__(parent)
-        self.language_manager = language_manager
+        super().__init__(parent, language_manager)
         self.setup_ui()
     
-    def tr(self, key, default=None):
-        """Get translated text."""
-        if self.language_manager:
-            return self.language_manager.tr(key, default)
-        return default or key
-        
     def setup_ui(self):
         layout = QVBoxLayout(self)
         
         # Trading Controls
-        controls_group = QGroupBox(self.tr("trading_controls", "Trading Controls"))
+        controls_group = self._make_group_box()
         controls_layout = QVBoxLayout(controls_group)
         
         # Connect/Disconnect button
         self.connect_btn = QPushButton(self.tr("connect", "Connect"))
-        self.connect_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; padding: 8px; }")
+        self.connect_btn.setStyleSheet(_BTN_GREEN_CSS)
         controls_layout.addWidget(self.connect_btn)
         
         # Start/Stop Trading button
         self.start_btn = QPushButton(self.tr("start_trading", "Start Trading"))
-        self.start_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; font-weight: bold; padding: 8px; }")
+        self.start_btn.setStyleSheet(_BTN_BLUE_CSS)
         self.start_btn.setEnabled(False)
         controls_layout.addWidget(self.start_btn)
         
@@ -402,265 +600,486 @@ class TradingControlsWidget(QWidget):
         """Update connection button state."""
         if connected:
             self.connect_btn.setText("Disconnect")
-            self.connect_btn.setStyleSheet("QPushButton { background-color: #f44336; color: white; font-weight: bold; padding: 8px; }")
+            self.connect_btn.setStyleSheet(_BTN_RED_CSS)
             self.start_btn.setEnabled(True)
         else:
             self.connect_btn.setText("Connect")
-            self.connect_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; padding: 8px; }")
+            self.connect_btn.setStyleSheet(_BTN_GREEN_CSS)
             self.start_btn.setEnabled(False)
     
     def update_trading_state(self, trading: bool):
         """Update trading button states."""
         if trading:
             self.start_btn.setText("Stop Trading")
-            self.start_btn.setStyleSheet("QPushButton { background-color: #f44336; color: white; font-weight: bold; padding: 8px; }")
+            self.start_btn.setStyleSheet(_BTN_RED_CSS)
         else:
             self.start_btn.setText("Start Trading")
-            self.start_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; font-weight: bold; padding: 8px; }")
+            self.start_btn.setStyleSheet(_BTN_BLUE_CSS)
+    
+    def _retranslate(self, language_manager):
+        """Apply translations, leaving button texts that reflect the current state alone."""
+        super()._retranslate(language_manager)
+        if self.connect_btn.text() not in _STATE_BUTTON_TEXTS:
+            self.connect_btn.setText(language_manager.tr("connect", "Connect"))
+        if self.start_btn.text() not in _STATE_BUTTON_TEXTS:
+            self.start_btn.setText(language_manager.tr("start_trading", "Start Trading"))
+
+
+@functools.cache
+def _risk_icon(color):
+    """Filled 12x12 dot used as a risk-level marker; built on first use since pixmaps need a QApplication."""
+    pixmap = QPixmap(12, 12)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(color))
+    painter.drawEllipse(1, 1, 10, 10)
+    painter.end()
+    return QIcon(pixmap)
+
+
+def _apply_column_widths(view):
+    """Give a positions view fixed column widths so row updates never re-lay out the header."""
+    header = view.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    header.setStretchLastSection(True)
+    for col, width in enumerate(_POSITION_COLUMN_WIDTHS):
+        view.setColumnWidth(col, width)
+    view.setSortingEnabled(False)
+
+
+class PositionsTableModel(QAbstractTableModel):
+    """Read-only table model backed by rows of preformatted cell text."""
     
-    def update_language(self, language_manager):
-        """Update widget text based on current language."""
-        try:
-            # Update group box title
-            controls_group = self.findChild(QGroupBox)
-            if controls_group:
-                controls_group.setTitle(language_manager.tr("trading_controls", "Trading Controls"))
-            
-            # Update button texts
-            if hasattr(self, 'connect_btn'):
-                if self.connect_btn.text() in ["Connect", "Disconnect"]:
-                    # Don't change button text based on current state
-                    pass
-                else:
-                    self.connect_btn.setText(language_manager.tr("connect", "Connect"))
-            
-            if hasattr(self, 'start_btn'):
-                if self.start_btn.text() in ["Start Trading", "Stop Trading"]:
-                    # Don't change button text based on current state
-                    pass
-                else:
-                    self.start_btn.setText(language_manager.tr("start_trading", "Start Trading"))
-        except Exception as e:
-            print(f"Error updating TradingControlsWidget language: {e}")
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows = []         # one tuple of cell strings per row
+        self._foregrounds = []  # one tuple of QBrush (or None) per row, or None for no colouring
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            brushes = self._foregrounds[index.row()]
+            return brushes[index.column()] if brushes else None
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+    
+    def set_headers(self, headers):
+        """Replace the column titles; unchanged titles are not re-signalled."""
+        if list(headers) == self._headers:
+            return
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self._headers) - 1)
+    
+    def set_rows(self, rows, foregrounds=None):
+        """Replace every row, signalling only the rows that changed and those added or removed at the end."""
+        if foregrounds is None:
+            foregrounds = [None] * len(rows)
+        old_count, new_count = len(self._rows), len(rows)
+        
+        # Edge-triggered: rows whose text and highlight are unchanged are not repainted.
+        # Only the common prefix is compared; the tail is inserted or removed below.
+        changed = [i for i, (old_row, new_row, old_fg, new_fg)
+                   in enumerate(zip(self._rows, rows, self._foregrounds, foregrounds, strict=False))
+                   if old_row != new_row or old_fg != new_fg]
+        
+        # A grown or shrunk table inserts or removes only its tail instead of resetting the view
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._rows, self._foregrounds = self._rows[:new_count], self._foregrounds[:new_count]
+            self.endRemoveRows()
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._rows, self._foregrounds = rows, foregrounds
+            self.endInsertRows()
+        else:
+            self._rows, self._foregrounds = rows, foregrounds
+        
+        # One dataChanged per run of consecutive changed rows
+        roles = [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole]
+        last_col = len(self._headers) - 1
+        start = prev = None
+        for i in changed:
+            if start is not None and i != prev + 1:
+                self.dataChanged.emit(self.index(start, 0), self.index(prev, last_col), roles)
+                start = None
+            if start is None:
+                start = i
+            prev = i
+        if start is not None:
+            self.dataChanged.emit(self.index(start, 0), self.index(prev, last_col), roles)
+
+
+class ClosedPositionsTableModel(PositionsTableModel):
+    """Newest-first table model; rows are stored oldest-first so adding trades is an append."""
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        last = len(self._rows) - 1
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[last - index.row()][index.column()]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            brushes = self._foregrounds[last - index.row()]
+            return brushes[index.column()] if brushes else None
+        return None
+    
+    def prepend_rows(self, rows, foregrounds):
+        """Show a batch of rows (oldest first) at the top in a single insert."""
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+        self._rows.extend(rows)
+        self._foregrounds.extend(foregrounds)
+        self.endInsertRows()
 
 
-class OpenPositionsWidget(QWidget):
+class OpenPositionsWidget(_TranslatableWidget):
     """Widget showing open positions with real-time PnL updates."""
     
+    _TR_GROUP = ("open_positions", "Open Positions")
+    _TR_HEADERS = (("symbol", "Symbol"), ("side", "Side"), ("entry_price", "Entry Price"),
+                   ("take_profit", "Take Profit"), ("stop_loss", "Stop Loss"))
+    
     def __init__(self, parent=None, language_manager=None):
-        super().__init__(parent)
-        self.language_manager = language_manager
+        super().__init__(parent, language_manager)
+        self._pending_positions: Optional[tuple] = None
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.FRAME_MS)
+        self._refresh_timer.timeout.connect(self._flush_positions)
+        # Kernel output buffers, grown to the largest position count seen so far
+        self._out_pnl = np.empty(0)
+        self._out_sl_hit = np.empty(0, dtype=np.bool_)
+        self._out_tp_hit = np.empty(0, dtype=np.bool_)
+        _warm_up_kernels()
         self.setup_ui()
     
-    def tr(self, key, default=None):
-        """Get translated text."""
-        if self.language_manager:
-            return self.language_manager.tr(key, default)
-        return default or key
-        
     def setup_ui(self):
         layout = QVBoxLayout(self)
         
         # Open Positions
-        positions_group = QGroupBox(self.tr("open_positions", "Open Positions"))
+        positions_group = self._make_group_box()
         positions_layout = QVBoxLayout(positions_group)
         
-        self.positions_table = QTableWidget()
-        self.positions_table.setColumnCount(5)
-        self.positions_table.setHorizontalHeaderLabels([
-            self.tr("symbol", "Symbol"), 
-            self.tr("side", "Side"), 
-            self.tr("entry_price", "Entry Price"), 
-            self.tr("take_profit", "Take Profit"),
-            self.tr("stop_loss", "Stop Loss")
-        ])
+        self.positions_model = PositionsTableModel(self._header_texts(), self)
+        self._header_model = self.positions_model
+        self.positions_table = QTableView()
+        self.positions_table.setModel(self.positions_model)
         
         # Disable editing
         self.positions_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         
-        # Set column widths
-        header = self.positions_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Fixed column widths, with the last column filling the rest
+        _apply_column_widths(self.positions_table)
         
         positions_layout.addWidget(self.positions_table)
         layout.addWidget(positions_group)
     
-    def update_language(self, language_manager):
-        """Update widget text based on current language."""
-        try:
-            # Update group box title
-            positions_group = self.findChild(QGroupBox)
-            if positions_group:
-                positions_group.setTitle(language_manager.tr("open_positions", "Open Positions"))
-            
-            # Update table headers
-            if hasattr(self, 'positions_table'):
-                headers = [
-                    language_manager.tr("symbol", "Symbol"),
-                    language_manager.tr("side", "Side"),
-                    language_manager.tr("entry_price", "Entry Price"),
-                    language_manager.tr("take_profit", "Take Profit"),
-                    language_manager.tr("stop_loss", "Stop Loss")
-                ]
-                self.positions_table.setHorizontalHeaderLabels(headers)
-        except Exception as e:
-            print(f"Error updating OpenPositionsWidget language: {e}")
+    def update_positions(self, positions, current_prices: Dict[str, float]):
+        """Schedule a table refresh; updates arriving within one frame collapse into one repaint.
+        
+        positions is either a PositionArray or a list of Position objects.
+        """
+        self._pending_positions = (positions, current_prices)
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+    
+    def _flush_positions(self):
+        """Apply the most recent pending positions update."""
+        pending, self._pending_positions = self._pending_positions, None
+        if pending is not None:
+            self._do_update_positions(*pending)
         
-    def update_positions(self, positions: List[Position], current_prices: Dict[str, float]):
+    def _do_update_positions(self, positions, current_prices: Dict[str, float]):
         """Update positions table with real-time data and advanced trade management."""
-        self.positions_table.setRowCount(len(positions))
-        
-        for i, position in enumerate(positions):
-            current_price = current_prices.get(position.symbol, position.current_price)
-            # Calculate unrealized PnL with micro lots
-            micro_lots = position.quantity / 1000
-            pnl = position.side * micro_lots * 10 * (current_price - position.entry_price)
-            
-            # Update PnL in real-time
-            position.unrealized_pnl = pnl
-            position.current_price = current_price
-            
-            # Determine status
-            status = "Active"
-            if hasattr(position, 'breakeven_triggered') and position.breakeven_triggered:
-                status = "Breakeven"
-            if hasattr(position, 'partial_closes') and position.partial_closes:
-                status = f"Partial ({len(position.partial_closes)})"
-            
-            self.positions_table.setItem(i, 0, QTableWidgetItem(position.symbol))
-            self.positions_table.setItem(i, 1, QTableWidgetItem("Long" if position.side > 0 else "Short"))
-            self.positions_table.setItem(i, 2, QTableWidgetItem(f"{position.entry_price:.4f}"))
-            
-            # Stop Loss column
-            sl_item = QTableWidgetItem(f"{position.stop_loss:.4f}" if position.stop_loss else "N/A")
-            if position.stop_loss:
-                # For Long: stop loss hit when price goes below stop loss
-                # For Short: stop loss hit when price goes above stop loss
-                if (position.side > 0 and current_price <= position.stop_loss) or (position.side < 0 and current_price >= position.stop_loss):
-                    sl_item.setForeground(QColor("red"))  # Stop loss hit
-            self.positions_table.setItem(i, 3, sl_item)
-            
-            # Take Profit column
-            tp_item = QTableWidgetItem(f"{position.take_profit:.4f}" if position.take_profit else "N/A")
-            if position.take_profit:
-                # For Long: take profit hit when price goes above take profit
-                # For Short: take profit hit when price goes below take profit
-                if (position.side > 0 and current_price >= position.take_profit) or (position.side < 0 and current_price <= position.take_profit):
-                    tp_item.setForeground(QColor("green"))  # Take profit hit
-            self.positions_table.setItem(i, 4, tp_item)
+        # Position lists are packed into columns; a PositionArray is used as is
+        objects = None
+        if not isinstance(positions, PositionArray):
+            objects, positions = positions, PositionArray.from_positions(positions)
+        
+        n = len(positions)
+        if not n:
+            self.positions_model.set_rows([])
+            return
+        
+        side, entry = positions.sides, positions.entry_price
+        sl, tp = positions.stop_loss, positions.take_profit
+        cur = positions.current_price
+        if current_prices:
+            cur = np.fromiter((current_prices.get(symbol, price) for symbol, price in zip(positions.symbols, cur, strict=True)),
+                              dtype=float, count=n)
+        
+        # Unrealized PnL (micro lots) and SL/TP hit masks for every position in one kernel call.
+        # NaN (no SL/TP set) compares False, so those rows never highlight.
+        if self._out_pnl.shape[0] < n:
+            self._out_pnl = np.empty(n)
+            self._out_sl_hit = np.empty(n, dtype=np.bool_)
+            self._out_tp_hit = np.empty(n, dtype=np.bool_)
+        compute_row_state(side, positions.quantity, entry, cur, sl, tp,
+                          self._out_pnl, self._out_sl_hit, self._out_tp_hit)
+        pnl, sl_hit, tp_hit = self._out_pnl[:n], self._out_sl_hit[:n], self._out_tp_hit[:n]
+        
+        # Format whole columns at once; unset SL/TP show as N/A
+        side_strs = np.where(side > 0, "Long", "Short").tolist()
+        entry_strs = np.char.mod("%.4f", entry).tolist()
+        sl_strs = np.where(np.isnan(sl), "N/A", np.char.mod("%.4f", sl)).tolist()
+        tp_strs = np.where(np.isnan(tp), "N/A", np.char.mod("%.4f", tp)).tolist()
+        rows = list(zip(positions.symbols.tolist(), side_strs, entry_strs, sl_strs, tp_strs, strict=True))
+        
+        red, green = _BRUSH_RED, _BRUSH_GREEN
+        foregrounds = [(None, None, None, red if sl_row else None, green if tp_row else None)
+                       for sl_row, tp_row in zip(sl_hit.tolist(), tp_hit.tolist(), strict=True)]
+        
+        # Update PnL in real-time on the Position objects this refresh was given
+        if objects is not None:
+            for position, value, price in zip(objects, pnl.tolist(), cur.tolist(), strict=True):
+                position.unrealized_pnl = value
+                position.current_price = price
+        
+        # One model update per refresh; the view only repaints the visible cells
+        self.positions_model.set_rows(rows, foregrounds)
 
 
-class ClosePositionsWidget(QWidget):
+class ClosePositionsWidget(_TranslatableWidget):
     """Widget showing closed positions history."""
     
+    _TR_GROUP = ("closed_positions", "Closed Positions")
+    _TR_HEADERS = (("symbol", "Symbol"), ("side", "Side"), ("entry_price", "Entry Price"),
+                   ("close_price", "Close Price"), ("pnl", "PnL"))
+    
     def __init__(self, parent=None, language_manager=None):
-        super().__init__(parent)
-        self.language_manager = language_manager
+        super().__init__(parent, language_manager)
+        self._lang_fp = None  # (language, table version) the texts were last applied for
+        self._pending_trades: List[Trade] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FRAME_MS)
+        self._flush_timer.timeout.connect(self._flush_trades)
         self.setup_ui()
     
-    def tr(self, key, default=None):
-        """Get translated text."""
-        if self.language_manager:
-            return self.language_manager.tr(key, default)
-        return default or key
-        
     def setup_ui(self):
         layout = QVBoxLayout(self)
         
         # Close Positions
-        closed_group = QGroupBox(self.tr("closed_positions", "Closed Positions"))
+        closed_group = self._make_group_box()
         closed_layout = QVBoxLayout(closed_group)
         
-        self.closed_table = QTableWidget()
-        self.closed_table.setColumnCount(5)
-        self.closed_table.setHorizontalHeaderLabels([
-            self.tr("symbol", "Symbol"), 
-            self.tr("side", "Side"), 
-            self.tr("entry_price", "Entry Price"), 
-            self.tr("close_price", "Close Price"), 
-            self.tr("pnl", "PnL")
-        ])
+        self.closed_model = ClosedPositionsTableModel(self._header_texts(), self)
+        self._header_model = self.closed_model
+        self.closed_table = QTableView()
+        self.closed_table.setModel(self.closed_model)
         
         # Disable editing
         self.closed_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         
-        # Set column widths
-        header = self.closed_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Fixed column widths, with the last column filling the rest
+        _apply_column_widths(self.closed_table)
         
         closed_layout.addWidget(self.closed_table)
         layout.addWidget(closed_group)
     
     def update_language(self, language_manager):
         """Update widget text based on current language."""
-        try:
-            # Update group box title
-            closed_group = self.findChild(QGroupBox)
-            if closed_group:
-                closed_group.setTitle(language_manager.tr("closed_positions", "Closed Positions"))
-            
-            # Update table headers
-            if hasattr(self, 'closed_table'):
-                headers = [
-                    language_manager.tr("symbol", "Symbol"),
-                    language_manager.tr("side", "Side"),
-                    language_manager.tr("entry_price", "Entry Price"),
-                    language_manager.tr("close_price", "Close Price"),
-                    language_manager.tr("pnl", "PnL")
-                ]
-                self.closed_table.setHorizontalHeaderLabels(headers)
-        except Exception as e:
-            print(f"Error updating ClosePositionsWidget language: {e}")
+        # Skip the rewrite when neither the language nor the loaded tables changed
+        fingerprint = (language_manager.current_language, language_manager.version)
+        if fingerprint == self._lang_fp:
+            return
+        self._lang_fp = fingerprint
+        super().update_language(language_manager)
         
     def add_closed_position(self, trade: Trade):
-        """Add a closed position to the table (newest first)."""
-        self.closed_table.insertRow(0)  # Insert at the top (row 0)
-        
-        # Symbol
-        self.closed_table.setItem(0, 0, QTableWidgetItem(trade.symbol))
-        
-        # Side
-        self.closed_table.setItem(0, 1, QTableWidgetItem("Long" if trade.side > 0 else "Short"))
-        
-        # Entry Price
-        self.closed_table.setItem(0, 2, QTableWidgetItem(f"{trade.entry_price:.4f}"))
-        
-        # Close Price
-        self.closed_table.setItem(0, 3, QTableWidgetItem(f"{trade.exit_price:.4f}"))
-        
-        # Color-code PnL
-        pnl_item = QTableWidgetItem(f"{trade.pnl:+.2f}")
-        if trade.pnl > 0:
-            pnl_item.setForeground(QColor("green"))
-        elif trade.pnl < 0:
-            pnl_item.setForeground(QColor("red"))
-        self.closed_table.setItem(0, 4, pnl_item)
-    
-    def update_language(self, language_manager):
-        """Update widget text based on current language."""
-        try:
-            # Update group box title
-            closed_group = self.findChild(QGroupBox)
-            if closed_group:
-                closed_group.setTitle(language_manager.tr("closed_positions", "Closed Positions"))
-            
-            # Update table headers
-            if hasattr(self, 'closed_table'):
-                headers = [
-                    language_manager.tr("symbol", "Symbol"),
-                    language_manager.tr("side", "Side"),
-                    language_manager.tr("entry_price", "Entry Price"),
-                    language_manager.tr("close_price", "Close Price"),
-                    language_manager.tr("pnl", "PnL")
-                ]
-                self.closed_table.setHorizontalHeaderLabels(headers)
-        except Exception as e:
-            print(f"Error updating ClosePositionsWidget language: {e}")
+        """Queue a closed position for the table (newest first); trades within one frame are added together."""
+        self._pending_trades.append(trade)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_trades(self):
+        """Insert every queued trade at the top of the table in one model update."""
+        pending, self._pending_trades = self._pending_trades, []
+        rows, foregrounds = [], []
+        for trade in pending:
+            # Color-code PnL
+            if trade.pnl > 0:
+                pnl_brush = _BRUSH_GREEN
+            elif trade.pnl < 0:
+                pnl_brush = _BRUSH_RED
+            else:
+                pnl_brush = None
+            
+            rows.append((
+                trade.symbol,
+                "Long" if trade.side > 0 else "Short",
+                f"{trade.entry_price:.4f}",
+                f"{trade.exit_price:.4f}",
+                f"{trade.pnl:+.2f}",
+            ))
+            foregrounds.append((None, None, None, None, pnl_brush))
+        self.closed_model.prepend_rows(rows, foregrounds)
 
 
 class EnhancedMainWindow(QMainWindow):
     """Enhanced main window with all new features."""
     
+    # Master tick cadence: monitor every tick, refresh every 4s, signals every 150th tick while trading
+    MASTER_TICK_MS = 2000
+    IDLE_TICK_MS = 10000  # tick interval while neither connected nor trading
+    REALTIME_EVERY_MS = 4000
+    SIGNAL_EVERY_TICKS = 150
+    
+    # Feature tab indices whose contents are refreshed by update_real_time_data (the Trading tab)
+    LIVE_TABS = frozenset({0})
+    
+    # Lines kept in the trading log; Qt drops the oldest block once the limit is reached
+    LOG_MAX_LINES = 2000
+    
+    # Minimum seconds between two signals for the same symbol
+    SIGNAL_COOLDOWN_S = 600.0
+    
+    # Seconds a fetched quote is reused by _get_price_cached
+    PRICE_CACHE_TTL = 0.5
+    
+    # Historical bars are re-fetched once per bar; between fetches the cached frame is reused
+    INTERVAL_SECONDS = {'1m': 60, '5m': 300, '15m': 900, '30m': 1800, '1h': 3600, '4h': 14400, '1d': 86400}
+    # Bars handed to strategy.indicators(); enough for the ML strategies' minimum training samples
+    HIST_WINDOW = 500
+    # Seconds closeEvent waits for broker teardown and the settings save before letting go
+    SHUTDOWN_TIMEOUT = 3.0
+    
+    # Translation keys and English defaults for the window chrome, resolved once per language
+    _TR_KEYS = (
+        # Window and status bar
+        ('app_title', 'ForexSmartBot'),
+        ('ready', 'Ready'),
+        ('trading_log', 'Trading Log'),
+        # Feature tabs
+        ('trading', 'Trading'),
+        ('analytics', 'Analytics'),
+        ('portfolio_analytics', 'Portfolio Analytics'),
+        ('charts', 'Charts'),
+        ('enhanced_charts', 'Enhanced Charts'),
+        ('strategy_builder', 'Strategy Builder'),
+        ('strategy_builder_info', 'Use the menu Tools > Strategy Builder to access the visual strategy builder'),
+        ('marketplace', 'Marketplace'),
+        ('marketplace_info', 'Use the menu Marketplace to browse and manage strategies'),
+        ('monitoring', 'Monitoring'),
+        ('cloud', 'Cloud'),
+        # File menu
+        ('file_menu', 'File'),
+        ('settings', 'Settings'),
+        ('exit', 'Exit'),
+        # Tools menu
+        ('tools_menu', 'Tools'),
+        ('backtest', 'Run Backtest'),
+        ('export_trades', 'Export Trades'),
+        ('optimization', 'Optimization'),
+        ('genetic_optimization', 'Genetic Algorithm'),
+        ('hyperparameter_optimization', 'Hyperparameter Optimization'),
+        ('walk_forward', 'Walk-Forward Analysis'),
+        ('monte_carlo', 'Monte Carlo Simulation'),
+        ('sensitivity_analysis', 'Parameter Sensitivity'),
+        ('multi_objective', 'Multi-Objective Optimization'),
+        ('adaptive_parameters', 'Adaptive Parameters'),
+        ('visual_builder', 'Visual Builder'),
+        ('templates', 'Strategy Templates'),
+        # Analytics menu
+        ('analytics_menu', 'Analytics'),
+        ('risk_analytics', 'Risk Analytics'),
+        ('performance_attribution', 'Performance Attribution'),
+        ('market_depth', 'Market Depth'),
+        ('correlation_matrix', 'Correlation Matrix'),
+        ('economic_calendar', 'Economic Calendar'),
+        ('trade_journal', 'Trade Journal'),
+        # Monitoring menu
+        ('monitoring_menu', 'Monitoring'),
+        ('strategy_monitor', 'Strategy Monitor'),
+        ('performance_tracker', 'Performance Tracker'),
+        ('health_check', 'Health Check'),
+        # Marketplace menu
+        ('marketplace_menu', 'Marketplace'),
+        ('browse_strategies', 'Browse Strategies'),
+        ('my_strategies', 'My Strategies'),
+        # Cloud menu
+        ('cloud_menu', 'Cloud'),
+        ('cloud_sync', 'Cloud Sync'),
+        ('remote_monitor', 'Remote Monitor'),
+        ('api_access', 'API Access'),
+        # Help menu
+        ('help_menu', 'Help'),
+        ('about', 'About'),
+        # Log messages
+        ('paper_broker_initialized', 'Paper broker initialized'),
+        ('broker_initialized', 'Broker initialized successfully'),
+        ('settings_loaded', 'Settings loaded successfully'),
+    )
+    
+    # Menu bar layout. Entries are (key, slot name) actions, (key, entries) submenus or None for a
+    # separator; keys are translation keys from _TR_KEYS
+    _MENU_SPEC = (
+        ('file_menu', (
+            ('settings', 'show_settings'),
+            None,
+            ('exit', 'close'),
+        )),
+        ('tools_menu', (
+            ('backtest', 'run_backtest'),
+            ('export_trades', 'export_trades'),
+            None,
+            ('optimization', (
+                ('genetic_optimization', 'show_genetic_optimization'),
+                ('hyperparameter_optimization', 'show_hyperparameter_optimization'),
+                ('walk_forward', 'show_walk_forward'),
+                ('monte_carlo', 'show_monte_carlo'),
+                ('sensitivity_analysis', 'show_sensitivity_analysis'),
+                ('multi_objective', 'show_multi_objective'),
+                ('adaptive_parameters', 'show_adaptive_parameters'),
+            )),
+            ('strategy_builder', (
+                ('visual_builder', 'show_strategy_builder'),
+                ('templates', 'show_strategy_templates'),
+            )),
+        )),
+        ('analytics_menu', (
+            ('portfolio_analytics', 'show_portfolio_analytics'),
+            ('risk_analytics', 'show_risk_analytics'),
+            ('performance_attribution', 'show_performance_attribution'),
+            None,
+            ('enhanced_charts', 'show_enhanced_charts'),
+            ('market_depth', 'show_market_depth'),
+            ('correlation_matrix', 'show_correlation_matrix'),
+            ('economic_calendar', 'show_economic_calendar'),
+            ('trade_journal', 'show_trade_journal'),
+        )),
+        ('monitoring_menu', (
+            ('strategy_monitor', 'show_strategy_monitor'),
+            ('performance_tracker', 'show_performance_tracker'),
+            ('health_check', 'show_health_check'),
+        )),
+        ('marketplace_menu', (
+            ('browse_strategies', 'show_marketplace'),
+            ('my_strategies', 'show_my_strategies'),
+        )),
+        ('cloud_menu', (
+            ('cloud_sync', 'show_cloud_sync'),
+            ('remote_monitor', 'show_remote_monitor'),
+            ('api_access', 'show_api_access'),
+        )),
+        ('help_menu', (
+            ('about', 'show_about'),
+        )),
+    )
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ForexSmartBot - Advanced Trading Platform")
@@ -668,6 +1087,9 @@ class EnhancedMainWindow(QMainWindow):
         # Initialize components
         self.settings_manager = SettingsManager()
         
+        # Verbose sizing/PnL/trade-count diagnostics are only formatted when enabled
+        self.debug_logging = DEBUG_TRADES or bool(self.settings_manager.get('debug_logging', False))
+        
         # Load window size from settings
         window_width = self.settings_manager.get('window_width', 1400)
         window_height = self.settings_manager.get('window_height', 900)
@@ -682,10 +1104,16 @@ class EnhancedMainWindow(QMainWindow):
         
         # Initialize language manager
         self.language_manager = LanguageManager(self.settings_manager)
-        self.language_manager.language_changed.connect(self.on_language_changed)
+        # Connected before any panel, so painting is off while the panels' own slots retranslate
+        self.language_manager.language_changed.connect(self._suspend_updates)
+        # Queued so widget retranslation always runs on the GUI thread, whoever changes the language
+        self.language_manager.language_changed.connect(self.on_language_changed, Qt.ConnectionType.QueuedConnection)
+        self._refresh_strings()
         
         # Initialize trading components
         self.portfolio = Portfolio(10000.0)
+        self._risk_config_key = None
+        self._risk_config = None
         self.risk_engine = RiskEngine(self._create_risk_config())
         self.trading_controller = None
         self.broker = None
@@ -695,20 +1123,73 @@ class EnhancedMainWindow(QMainWindow):
         self.is_connected = False
         self.is_trading = False
         self.positions = []
+        self._positions_by_symbol = {}  # symbol -> indices into self.positions
+        self._opened_epochs = np.empty(0)  # ts_epoch per position (NaN if unknown)
+        self._position_cols = None  # PositionArray of self.positions, rebuilt lazily after changes
+        self._account_sync_pending = False  # balance/positions fetch on the order pool still in flight
+        self._broker_balance = None  # last broker balance shown and its formatted label text
+        self._broker_balance_text = ''
+        self._open_pnl = 0.0  # sum of pnl over self.positions
+        self._label_qss = {}  # label -> last stylesheet applied by _set_color
         self.closed_trades = []
+        # Running closed-trade totals, updated once per trade instead of re-summed every tick
+        self._agg = {'count': 0, 'closed_pnl': 0.0, 'wins': 0, 'gross_profit': 0.0, 'gross_loss': 0.0}
+        
+        # Per-day closed-trade count and PnL in a ring buffer indexed by date ordinal % 32
+        self._daily_counts = np.zeros(32, dtype=np.int32)
+        self._daily_pnl = np.zeros(32, dtype=np.float64)
+        self._daily_ordinal = np.zeros(32, dtype=np.int64)
+        
+        # Sections needing a redraw on the next real-time tick ('positions', 'metrics')
+        self._dirty = {'positions', 'metrics'}
+        # Raw values the status and metrics panels were last rendered from
+        self._last_portfolio_state = None
+        self._last_metrics_state = None
+        self._positions_snapshot = None
+        self.last_activity_log = datetime.now()
+        
+        # Highest equity seen and the drawdown from it, maintained by update_portfolio_with_position
+        self.peak_equity = 0.0
+        self._current_drawdown = 0.0
+        self._monitoring_active = None  # trading state last shown in the monitoring label
+        
+        # Pre-generated ±0.1% exit-price jitter, consumed round-robin
+        self._jitter = np.random.default_rng().uniform(-0.001, 0.001, size=65536)
+        self._jitter_i = 0
         
         # Signal cooldown to prevent too frequent signals
-        self.signal_cooldown = {}  # symbol -> last_signal_time
+        self.signal_cooldown = {}  # symbol -> monotonic() time of last signal
+        
+        # Dedicated pool for strategy evaluation, capped at 3 symbols in flight
+        self.signal_pool = QThreadPool(self)
+        self.signal_pool.setMaxThreadCount(3)
+        # Strategies keep state (trained models, timeframe data), so one evaluates at a time
+        self._strategy_lock = threading.Lock()
+        self._pending_signals = deque()  # (symbol, signal, price, epoch) awaiting execution
+        self._trade_epoch = 0  # bumped by stop_trading to invalidate in-flight signal work
+        
+        # Single-threaded pool: every broker command goes through it, so MT4's one command file
+        # only ever sees one command at a time, in the order they were issued
+        self.order_pool = QThreadPool(self)
+        self.order_pool.setMaxThreadCount(1)
+        self._draining = False
+        
+        # Historical data cache keyed by (symbol, interval), filled by SignalWorker threads
+        self._hist_cache = {}  # (symbol, interval) -> DataFrame ending in a live-quote row
+        self._hist_last_fetch = {}  # (symbol, interval) -> datetime of last fetch
+        self._price_cache = {}  # symbol -> (monotonic() time, price)
         
         # Daily trade counter to track trades per day
         self.daily_trade_count = 0
         self.last_trade_date = None
         
-        # Initialize monitoring components (shared instance)
-        from ..monitoring.strategy_monitor import StrategyMonitor
-        from ..monitoring.performance_tracker import PerformanceTracker
-        self.strategy_monitor = StrategyMonitor()
-        self.performance_tracker = PerformanceTracker()
+        # Monitoring components (shared instances), created on first use
+        self._strategy_monitor = None
+        self._performance_tracker = None
+        
+        # (owner, setter, key) triples re-applied from self._strings on language change, filled by setup_ui
+        self._i18n_bindings = []
+        self._last_ui_lang = None  # (language, table version) the UI text was last applied in
         
         # Setup UI
         self.setup_ui()
@@ -772,6 +1253,7 @@ class EnhancedMainWindow(QMainWindow):
         
         # Create tabbed interface for all features
         self.features_tabs = QTabWidget()
+        self._tab_index = {}  # translation key -> feature tab index
         
         # Tab 1: Trading (Positions and Log)
         trading_tab = QWidget()
@@ -786,105 +1268,74 @@ class EnhancedMainWindow(QMainWindow):
         trading_tab_layout.addWidget(self.close_positions_widget)
         
         # Trading Log
-        log_group = QGroupBox(self.language_manager.tr("trading_log", "Trading Log"))
+        log_group = QGroupBox(self._strings['trading_log'])
+        self._bind_text(log_group.setTitle, 'trading_log')
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setMaximumHeight(200)
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.LOG_MAX_LINES)
         log_layout.addWidget(self.log_text)
         
-        trading_tab_layout.addWidget(log_group)
+        # Buffer log lines and flush them to the widget in one append every 100ms
+        self._log_buf = deque(maxlen=10000)  # (time, message) pairs awaiting flush
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.log_flush_timer.timeout.connect(self._flush_log)
+        self.log_flush_timer.start(100)
         
-        self.features_tabs.addTab(trading_tab, self.language_manager.tr("trading", "Trading"))
+        trading_tab_layout.addWidget(log_group)
         
-        # Tab 2: Analytics
-        analytics_tab = QWidget()
-        analytics_tab_layout = QVBoxLayout(analytics_tab)
+        self._tr_tab(trading_tab, 'trading')
         
-        # Portfolio Analytics Widget
-        try:
-            from ..analytics.portfolio_analytics import PortfolioAnalytics
-            from ..ui.analytics_widget import PortfolioAnalyticsWidget
-            self.portfolio_analytics_widget = PortfolioAnalyticsWidget(self.portfolio, parent=analytics_tab)
-            analytics_tab_layout.addWidget(self.portfolio_analytics_widget)
-        except ImportError:
-            analytics_label = QLabel(self.language_manager.tr("portfolio_analytics", "Portfolio Analytics"))
-            analytics_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            analytics_tab_layout.addWidget(analytics_label)
+        # Heavy tabs start as empty placeholders and are built the first time they are shown
+        self._tab_factories = {}
+        self._tab_realized = set()
         
-        self.features_tabs.addTab(analytics_tab, self.language_manager.tr("analytics", "Analytics"))
+        # Tab 2: Analytics
+        self._tr_lazy_tab('analytics', self._build_analytics_tab)
         
         # Tab 3: Charts
-        charts_tab = QWidget()
-        charts_tab_layout = QVBoxLayout(charts_tab)
-        
-        try:
-            from ..ui.enhanced_charts import EnhancedChartWidget
-            self.enhanced_chart_widget = EnhancedChartWidget(parent=charts_tab)
-            # Pass data provider reference if available
-            if hasattr(self, 'data_provider') and self.data_provider:
-                self.enhanced_chart_widget.data_provider = self.data_provider
-            charts_tab_layout.addWidget(self.enhanced_chart_widget)
-        except ImportError:
-            charts_label = QLabel(self.language_manager.tr("enhanced_charts", "Enhanced Charts"))
-            charts_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            charts_tab_layout.addWidget(charts_label)
-        
-        self.features_tabs.addTab(charts_tab, self.language_manager.tr("charts", "Charts"))
+        self._tr_lazy_tab('charts', self._build_charts_tab)
         
         # Tab 4: Strategy Builder
         builder_tab = QWidget()
         builder_tab_layout = QVBoxLayout(builder_tab)
         
-        builder_label = QLabel(self.language_manager.tr("strategy_builder_info", 
-            "Use the menu Tools > Strategy Builder to access the visual strategy builder"))
+        builder_label = QLabel(self._strings['strategy_builder_info'])
+        self._bind_text(builder_label.setText, 'strategy_builder_info')
         builder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         builder_label.setWordWrap(True)
         builder_tab_layout.addWidget(builder_label)
         
-        self.features_tabs.addTab(builder_tab, self.language_manager.tr("strategy_builder", "Strategy Builder"))
+        self._tr_tab(builder_tab, 'strategy_builder')
         
         # Tab 5: Marketplace
         marketplace_tab = QWidget()
         marketplace_tab_layout = QVBoxLayout(marketplace_tab)
         
-        marketplace_label = QLabel(self.language_manager.tr("marketplace_info",
-            "Use the menu Marketplace to browse and manage strategies"))
+        marketplace_label = QLabel(self._strings['marketplace_info'])
+        self._bind_text(marketplace_label.setText, 'marketplace_info')
         marketplace_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         marketplace_label.setWordWrap(True)
         marketplace_tab_layout.addWidget(marketplace_label)
         
-        self.features_tabs.addTab(marketplace_tab, self.language_manager.tr("marketplace", "Marketplace"))
+        self._tr_tab(marketplace_tab, 'marketplace')
         
         # Tab 6: Monitoring
-        monitoring_tab = QWidget()
-        monitoring_tab_layout = QVBoxLayout(monitoring_tab)
-        
-        try:
-            from ..monitoring.strategy_monitor import StrategyMonitor
-            from ..ui.monitoring_widget import StrategyMonitorWidget
-            self.strategy_monitor_widget = StrategyMonitorWidget(parent=monitoring_tab)
-            monitoring_tab_layout.addWidget(self.strategy_monitor_widget)
-        except ImportError:
-            monitoring_label = QLabel(self.language_manager.tr("monitoring", "Monitoring"))
-            monitoring_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            monitoring_tab_layout.addWidget(monitoring_label)
-        
-        self.features_tabs.addTab(monitoring_tab, self.language_manager.tr("monitoring", "Monitoring"))
+        self._tr_lazy_tab('monitoring', self._build_monitoring_tab)
         
         # Tab 7: Cloud
         cloud_tab = QWidget()
         cloud_tab_layout = QVBoxLayout(cloud_tab)
         
         # Get actual values from environment variables
-        import os
-        from dotenv import load_dotenv
-        load_dotenv(override=False)
-        monitor_host = os.getenv('REMOTE_MONITOR_HOST', '127.0.0.1')
-        monitor_port = os.getenv('REMOTE_MONITOR_PORT', '8080')
-        api_host = os.getenv('API_HOST', '127.0.0.1')
-        api_port = os.getenv('API_PORT', '5000')
+        env = _load_env()
+        monitor_host = env['REMOTE_MONITOR_HOST']
+        monitor_port = env['REMOTE_MONITOR_PORT']
+        api_host = env['API_HOST']
+        api_port = env['API_PORT']
         
         cloud_info = QLabel(self.language_manager.tr("cloud_info",
             f"Cloud Sync: Synchronize settings and data across devices\n"
@@ -895,8 +1346,11 @@ class EnhancedMainWindow(QMainWindow):
         cloud_info.setWordWrap(True)
         cloud_tab_layout.addWidget(cloud_info)
         
-        self.features_tabs.addTab(cloud_tab, self.language_manager.tr("cloud", "Cloud"))
+        self._tr_tab(cloud_tab, 'cloud')
         
+        self.features_tabs.currentChanged.connect(self._realize_tab)
+        self.features_tabs.currentChanged.connect(self._on_features_tab_changed)
+        self._apply_tab_visibility()
         right_layout.addWidget(self.features_tabs)
         
         # Add panels to main layout
@@ -911,162 +1365,131 @@ class EnhancedMainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
         
+    @property
+    def strategy_monitor(self):
+        """Shared StrategyMonitor, imported and created on first access."""
+        if self._strategy_monitor is None:
+            from ..monitoring.strategy_monitor import StrategyMonitor
+            self._strategy_monitor = StrategyMonitor()
+        return self._strategy_monitor
+    
+    @property
+    def performance_tracker(self):
+        """Shared PerformanceTracker, imported and created on first access."""
+        if self._performance_tracker is None:
+            from ..monitoring.performance_tracker import PerformanceTracker
+            self._performance_tracker = PerformanceTracker()
+        return self._performance_tracker
+    
+    def _bind_text(self, setter, key, owner=None):
+        """Register a text setter to be re-applied with self._strings[key] on language change."""
+        # owner is the Qt object the setter writes to; bindings are dropped once it is deleted
+        self._i18n_bindings.append((owner if owner is not None else setter.__self__, setter, key))
+    
+    def _tr_action(self, key):
+        """Create a window-owned QAction whose text follows the current language."""
+        action = QAction(self._strings[key], self)
+        self._bind_text(action.setText, key)
+        return action
+    
+    def _add_action(self, menu, key, slot):
+        """Add a translated action to menu that calls slot when triggered."""
+        action = self._tr_action(key)
+        action.triggered.connect(slot)
+        menu.addAction(action)
+        return action
+    
+    def _tr_menu(self, parent, key):
+        """Add a submenu whose title follows the current language."""
+        menu = parent.addMenu(self._strings[key])
+        self._bind_text(menu.setTitle, key)
+        return menu
+    
+    def _tr_tab(self, widget, key):
+        """Add a feature tab whose label follows the current language."""
+        index = self.features_tabs.addTab(widget, self._strings[key])
+        self._bind_text(functools.partial(self.features_tabs.setTabText, index), key, owner=self.features_tabs)
+        self._tab_index[key] = index
+        return index
+    
+    def _apply_tab_visibility(self):
+        """Show or hide the optional feature tabs per their tab_<key>_enabled settings."""
+        # Hidden lazy tabs are never activated, so their contents are never built
+        for key, _ in FEATURE_TABS:
+            index = self._tab_index.get(key)
+            if index is not None:
+                self.features_tabs.setTabVisible(index, bool(self.settings_manager.get(f'tab_{key}_enabled', True)))
+    
+    def _tr_lazy_tab(self, key, factory):
+        """Add a placeholder feature tab; factory(tab) fills it in the first time the tab is shown."""
+        tab = QWidget()
+        QVBoxLayout(tab)
+        index = self._tr_tab(tab, key)
+        self._tab_factories[index] = factory
+        return index
+    
+    def _realize_tab(self, index):
+        """Build a lazily created tab's contents on its first activation."""
+        if index in self._tab_realized or index not in self._tab_factories:
+            return
+        self._tab_realized.add(index)
+        try:
+            self._tab_factories.pop(index)(self.features_tabs.widget(index))
+        except Exception as e:
+            self.append_log(f"Error building tab: {e}")
+    
+    def _tab_placeholder(self, tab, key):
+        """Fill a tab with a centered label when its feature module is unavailable."""
+        label = QLabel(self._strings[key])
+        self._bind_text(label.setText, key)
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        tab.layout().addWidget(label)
+    
+    def _build_analytics_tab(self, tab):
+        """Portfolio analytics tab contents."""
+        try:
+            from ..ui.analytics_widget import PortfolioAnalyticsWidget
+            self.portfolio_analytics_widget = PortfolioAnalyticsWidget(self.portfolio, parent=tab)
+            tab.layout().addWidget(self.portfolio_analytics_widget)
+        except ImportError:
+            self._tab_placeholder(tab, 'portfolio_analytics')
+    
+    def _build_charts_tab(self, tab):
+        """Enhanced charts tab contents."""
+        try:
+            from ..ui.enhanced_charts import EnhancedChartWidget
+            self.enhanced_chart_widget = EnhancedChartWidget(parent=tab)
+            # Pass data provider reference if available
+            if hasattr(self, 'data_provider') and self.data_provider:
+                self.enhanced_chart_widget.data_provider = self.data_provider
+            tab.layout().addWidget(self.enhanced_chart_widget)
+        except ImportError:
+            self._tab_placeholder(tab, 'enhanced_charts')
+    
+    def _build_monitoring_tab(self, tab):
+        """Strategy monitoring tab contents."""
+        try:
+            # The lazy property raises ImportError when the monitoring backend is unavailable
+            monitor = self.strategy_monitor
+            from ..ui.monitoring_widget import StrategyMonitorWidget
+            self.strategy_monitor_widget = StrategyMonitorWidget(parent=tab, monitor=monitor)
+            tab.layout().addWidget(self.strategy_monitor_widget)
+        except ImportError:
+            self._tab_placeholder(tab, 'monitoring')
+    
     def setup_menu_bar(self):
         """Setup menu bar."""
-        menubar = self.menuBar()
-        
-        # File menu
-        file_menu = menubar.addMenu(self.language_manager.tr("file_menu", "File"))
-        
-        settings_action = QAction(self.language_manager.tr("settings", "Settings"), self)
-        settings_action.triggered.connect(self.show_settings)
-        file_menu.addAction(settings_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction(self.language_manager.tr("exit", "Exit"), self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Tools menu
-        tools_menu = menubar.addMenu(self.language_manager.tr("tools_menu", "Tools"))
-        
-        backtest_action = QAction(self.language_manager.tr("backtest", "Run Backtest"), self)
-        backtest_action.triggered.connect(self.run_backtest)
-        tools_menu.addAction(backtest_action)
-        
-        export_action = QAction(self.language_manager.tr("export_trades", "Export Trades"), self)
-        export_action.triggered.connect(self.export_trades)
-        tools_menu.addAction(export_action)
-        
-        tools_menu.addSeparator()
-        
-        # Optimization submenu
-        optimization_menu = tools_menu.addMenu(self.language_manager.tr("optimization", "Optimization"))
-        
-        genetic_opt_action = QAction(self.language_manager.tr("genetic_optimization", "Genetic Algorithm"), self)
-        genetic_opt_action.triggered.connect(self.show_genetic_optimization)
-        optimization_menu.addAction(genetic_opt_action)
-        
-        hyperparameter_opt_action = QAction(self.language_manager.tr("hyperparameter_optimization", "Hyperparameter Optimization"), self)
-        hyperparameter_opt_action.triggered.connect(self.show_hyperparameter_optimization)
-        optimization_menu.addAction(hyperparameter_opt_action)
-        
-        walk_forward_action = QAction(self.language_manager.tr("walk_forward", "Walk-Forward Analysis"), self)
-        walk_forward_action.triggered.connect(self.show_walk_forward)
-        optimization_menu.addAction(walk_forward_action)
-        
-        monte_carlo_action = QAction(self.language_manager.tr("monte_carlo", "Monte Carlo Simulation"), self)
-        monte_carlo_action.triggered.connect(self.show_monte_carlo)
-        optimization_menu.addAction(monte_carlo_action)
-        
-        sensitivity_action = QAction(self.language_manager.tr("sensitivity_analysis", "Parameter Sensitivity"), self)
-        sensitivity_action.triggered.connect(self.show_sensitivity_analysis)
-        optimization_menu.addAction(sensitivity_action)
-        
-        multi_objective_action = QAction(self.language_manager.tr("multi_objective", "Multi-Objective Optimization"), self)
-        multi_objective_action.triggered.connect(self.show_multi_objective)
-        optimization_menu.addAction(multi_objective_action)
-        
-        adaptive_params_action = QAction(self.language_manager.tr("adaptive_parameters", "Adaptive Parameters"), self)
-        adaptive_params_action.triggered.connect(self.show_adaptive_parameters)
-        optimization_menu.addAction(adaptive_params_action)
-        
-        # Strategy Builder submenu
-        builder_menu = tools_menu.addMenu(self.language_manager.tr("strategy_builder", "Strategy Builder"))
-        
-        visual_builder_action = QAction(self.language_manager.tr("visual_builder", "Visual Builder"), self)
-        visual_builder_action.triggered.connect(self.show_strategy_builder)
-        builder_menu.addAction(visual_builder_action)
-        
-        templates_action = QAction(self.language_manager.tr("templates", "Strategy Templates"), self)
-        templates_action.triggered.connect(self.show_strategy_templates)
-        builder_menu.addAction(templates_action)
-        
-        # Analytics menu
-        analytics_menu = menubar.addMenu(self.language_manager.tr("analytics_menu", "Analytics"))
-        
-        portfolio_analytics_action = QAction(self.language_manager.tr("portfolio_analytics", "Portfolio Analytics"), self)
-        portfolio_analytics_action.triggered.connect(self.show_portfolio_analytics)
-        analytics_menu.addAction(portfolio_analytics_action)
-        
-        risk_analytics_action = QAction(self.language_manager.tr("risk_analytics", "Risk Analytics"), self)
-        risk_analytics_action.triggered.connect(self.show_risk_analytics)
-        analytics_menu.addAction(risk_analytics_action)
-        
-        performance_attribution_action = QAction(self.language_manager.tr("performance_attribution", "Performance Attribution"), self)
-        performance_attribution_action.triggered.connect(self.show_performance_attribution)
-        analytics_menu.addAction(performance_attribution_action)
-        
-        analytics_menu.addSeparator()
-        
-        enhanced_charts_action = QAction(self.language_manager.tr("enhanced_charts", "Enhanced Charts"), self)
-        enhanced_charts_action.triggered.connect(self.show_enhanced_charts)
-        analytics_menu.addAction(enhanced_charts_action)
-        
-        market_depth_action = QAction(self.language_manager.tr("market_depth", "Market Depth"), self)
-        market_depth_action.triggered.connect(self.show_market_depth)
-        analytics_menu.addAction(market_depth_action)
-        
-        correlation_matrix_action = QAction(self.language_manager.tr("correlation_matrix", "Correlation Matrix"), self)
-        correlation_matrix_action.triggered.connect(self.show_correlation_matrix)
-        analytics_menu.addAction(correlation_matrix_action)
-        
-        economic_calendar_action = QAction(self.language_manager.tr("economic_calendar", "Economic Calendar"), self)
-        economic_calendar_action.triggered.connect(self.show_economic_calendar)
-        analytics_menu.addAction(economic_calendar_action)
-        
-        trade_journal_action = QAction(self.language_manager.tr("trade_journal", "Trade Journal"), self)
-        trade_journal_action.triggered.connect(self.show_trade_journal)
-        analytics_menu.addAction(trade_journal_action)
-        
-        # Monitoring menu
-        monitoring_menu = menubar.addMenu(self.language_manager.tr("monitoring_menu", "Monitoring"))
-        
-        strategy_monitor_action = QAction(self.language_manager.tr("strategy_monitor", "Strategy Monitor"), self)
-        strategy_monitor_action.triggered.connect(self.show_strategy_monitor)
-        monitoring_menu.addAction(strategy_monitor_action)
-        
-        performance_tracker_action = QAction(self.language_manager.tr("performance_tracker", "Performance Tracker"), self)
-        performance_tracker_action.triggered.connect(self.show_performance_tracker)
-        monitoring_menu.addAction(performance_tracker_action)
-        
-        health_check_action = QAction(self.language_manager.tr("health_check", "Health Check"), self)
-        health_check_action.triggered.connect(self.show_health_check)
-        monitoring_menu.addAction(health_check_action)
-        
-        # Marketplace menu
-        marketplace_menu = menubar.addMenu(self.language_manager.tr("marketplace_menu", "Marketplace"))
-        
-        browse_strategies_action = QAction(self.language_manager.tr("browse_strategies", "Browse Strategies"), self)
-        browse_strategies_action.triggered.connect(self.show_marketplace)
-        marketplace_menu.addAction(browse_strategies_action)
-        
-        my_strategies_action = QAction(self.language_manager.tr("my_strategies", "My Strategies"), self)
-        my_strategies_action.triggered.connect(self.show_my_strategies)
-        marketplace_menu.addAction(my_strategies_action)
-        
-        # Cloud menu
-        cloud_menu = menubar.addMenu(self.language_manager.tr("cloud_menu", "Cloud"))
-        
-        cloud_sync_action = QAction(self.language_manager.tr("cloud_sync", "Cloud Sync"), self)
-        cloud_sync_action.triggered.connect(self.show_cloud_sync)
-        cloud_menu.addAction(cloud_sync_action)
-        
-        remote_monitor_action = QAction(self.language_manager.tr("remote_monitor", "Remote Monitor"), self)
-        remote_monitor_action.triggered.connect(self.show_remote_monitor)
-        cloud_menu.addAction(remote_monitor_action)
-        
-        api_access_action = QAction(self.language_manager.tr("api_access", "API Access"), self)
-        api_access_action.triggered.connect(self.show_api_access)
-        cloud_menu.addAction(api_access_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu(self.language_manager.tr("help_menu", "Help"))
-        
-        about_action = QAction(self.language_manager.tr("about", "About"), self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        self._build_menu(self.menuBar(), self._MENU_SPEC)
+    
+    def _build_menu(self, parent, entries):
+        """Add the actions, submenus and separators described by a _MENU_SPEC entry list to parent."""
+        for entry in entries:
+            if entry is None:
+                parent.addSeparator()
+            elif isinstance(entry[1], str):
+                self._add_action(parent, entry[0], getattr(self, entry[1]))
+            else:
+                self._build_menu(self._tr_menu(parent, entry[0]), entry[1])
         
     def setup_connections(self):
         """Setup signal connections."""
@@ -1075,25 +1498,65 @@ class EnhancedMainWindow(QMainWindow):
         self.trading_controls_widget.start_btn.clicked.connect(self.toggle_trading)
         
     def setup_timers(self):
-        """Setup timers for real-time updates."""
-        # Update timer for real-time data (less frequent to prevent freezing)
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_real_time_data)
-        self.update_timer.start(5000)  # Update every 5 seconds (reduced frequency to avoid excessive polling)
+        """Setup the single coalesced timer driving all periodic work."""
+        self._realtime_ms = 0
+        self._signal_ticks = 0
+        self._signal_strategy = None
+        self._signal_symbols = []
+        
+        # One coarse single-shot tick, re-armed after each dispatch with an adaptive interval
+        self.master_timer = QTimer()
+        self.master_timer.setSingleShot(True)
+        self.master_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.master_timer.timeout.connect(self._on_master_tick)
+        self._schedule_tick()
+        
+    def _schedule_tick(self):
+        """Arm the next master tick, pulling a pending slow idle tick forward once work starts."""
+        interval = self.MASTER_TICK_MS if self.is_connected or self.is_trading else self.IDLE_TICK_MS
+        if not self.master_timer.isActive() or self.master_timer.remainingTime() > interval:
+            self.master_timer.start(interval)
+        
+    def _on_master_tick(self):
+        """Dispatch monitoring, real-time refresh and signal generation, then arm the next tick."""
+        try:
+            self._realtime_ms += self.master_timer.interval()
+            self.monitor_trading_activity()
+            
+            if self._realtime_ms >= self.REALTIME_EVERY_MS:
+                self._realtime_ms = 0
+                self.update_real_time_data()
+            
+            if self.is_trading and self._signal_strategy is not None:
+                self._signal_ticks += 1
+                if self._signal_ticks >= self.SIGNAL_EVERY_TICKS:
+                    self._signal_ticks = 0
+                    self.generate_signals(self._signal_strategy, self._signal_symbols)
+        finally:
+            # Re-arm even if a step raised, so the chain never stops
+            self._schedule_tick()
         
     def _create_risk_config(self):
-        """Create risk configuration from settings."""
-        return RiskConfig(
-            base_risk_pct=self.settings_manager.get('base_risk_pct', 0.1) / 100.0,
-            max_risk_pct=self.settings_manager.get('max_risk_pct', 0.2) / 100.0,
-            daily_risk_cap=self.settings_manager.get('daily_risk_cap', 0.2) / 100.0,
-            max_drawdown_pct=self.settings_manager.get('max_drawdown_pct', 0.5) / 100.0,
+        """Risk configuration from settings, rebuilt only when the underlying settings changed."""
+        get = self.settings_manager.get
+        key = (get('base_risk_pct', 0.1), get('max_risk_pct', 0.2), get('daily_risk_cap', 0.2),
+               get('max_drawdown_pct', 0.5), get('trade_amount_min', 10.0), get('trade_amount_max', 100.0))
+        if key == self._risk_config_key:
+            return self._risk_config
+        base_risk, max_risk, daily_cap, max_drawdown, amount_min, amount_max = key
+        self._risk_config_key = key
+        self._risk_config = RiskConfig(
+            base_risk_pct=base_risk / 100.0,
+            max_risk_pct=max_risk / 100.0,
+            daily_risk_cap=daily_cap / 100.0,
+            max_drawdown_pct=max_drawdown / 100.0,
             drawdown_recovery_pct=0.10,
             kelly_fraction=0.25,
             volatility_target=0.01,
-            min_trade_amount=self.settings_manager.get('trade_amount_min', 10.0),
-            max_trade_amount=self.settings_manager.get('trade_amount_max', 100.0)
+            min_trade_amount=amount_min,
+            max_trade_amount=amount_max
         )
+        return self._risk_config
         
     def initialize_broker(self):
         """Initialize broker and data provider based on settings."""
@@ -1109,24 +1572,22 @@ class EnhancedMainWindow(QMainWindow):
             # Initialize broker based on mode
             if broker_mode == 'PAPER':
                 self.broker = PaperBroker(10000.0)
-                self.append_log(self.language_manager.tr("paper_broker_initialized", "Paper broker initialized"))
+                self.append_log(self._strings['paper_broker_initialized'])
             elif broker_mode == 'MT4':
                 # Check if MT4 settings are configured (from settings or env vars)
-                import os
                 mt4_host = self.settings_manager.get('mt4_host')
                 if not mt4_host:
-                    mt4_host = os.getenv('MT4_ZMQ_HOST', '127.0.0.1')
+                    mt4_host = _load_env()['MT4_ZMQ_HOST']
                 
                 mt4_port = self.settings_manager.get('mt4_port')
                 if not mt4_port or mt4_port == 0:
-                    mt4_port = int(os.getenv('MT4_ZMQ_PORT', '5555'))
+                    mt4_port = int(_load_env()['MT4_ZMQ_PORT'])
                 
                 self.append_log(f"MT4 settings - Host: {mt4_host}, Port: {mt4_port}")
                 if not mt4_host or mt4_port == 0:
                     self.append_log("MT4 settings not configured - using paper broker")
                     self.broker = PaperBroker(10000.0)
                 else:
-                    from forexsmartbot.adapters.brokers.mt4_broker import MT4Broker
                     self.broker = MT4Broker(host=mt4_host, port=mt4_port)
                     self.append_log(f"MT4 broker initialized: {mt4_host}:{mt4_port}")
             elif broker_mode == 'REST API':
@@ -1138,7 +1599,6 @@ class EnhancedMainWindow(QMainWindow):
                     self.append_log("REST API settings not configured - using paper broker")
                     self.broker = PaperBroker(10000.0)
                 else:
-                    from forexsmartbot.adapters.brokers.rest_broker import RestBroker
                     self.broker = RestBroker(api_key=api_key, api_secret=api_secret, base_url=base_url)
                     self.append_log("REST API broker initialized")
             elif broker_mode == 'IB TWS':
@@ -1180,7 +1640,7 @@ class EnhancedMainWindow(QMainWindow):
             # Update broker status display
             self.update_broker_status(broker_mode)
             
-            self.append_log(self.language_manager.tr("broker_initialized", "Broker initialized successfully"))
+            self.append_log(self._strings['broker_initialized'])
             
         except Exception as e:
             self.append_log(f"Error initializing broker: {str(e)}")
@@ -1192,53 +1652,16 @@ class EnhancedMainWindow(QMainWindow):
         """Toggle broker connection."""
         try:
             if not self.is_connected:
-                # Connect
-                if self.broker and self.broker.connect():
-                    self.is_connected = True
-                    self.trading_status_widget.connection_status.setText("Connected")
-                    self.trading_status_widget.connection_status.setStyleSheet("color: green; font-weight: bold;")
-                    self.trading_controls_widget.update_connection_state(True)
-                    self.append_log("Connected to broker successfully")
-                    self.status_bar.showMessage("Connected")
-                    
-                    # Get real balance from MT4
-                    try:
-                        real_balance = self.broker.get_balance()
-                        if real_balance:
-                            self.trading_status_widget.balance_label.setText(f"${real_balance:,.2f}")
-                            self.trading_status_widget.equity_label.setText(f"${real_balance:,.2f}")
-                            self.append_log(f"Real balance retrieved: ${real_balance:,.2f}")
-                        else:
-                            self.append_log("Failed to get real balance: No response from MT4")
-                    except Exception as e:
-                        self.append_log(f"Failed to get real balance: {e}")
-                    
-                    # Sync positions from MT4
-                    try:
-                        mt4_positions = self.broker.get_positions()
-                        if mt4_positions:
-                            # Convert Position objects to dictionary format
-                            self.positions = []
-                            for symbol, position in mt4_positions.items():
-                                pos_dict = {
-                                    'symbol': position.symbol,
-                                    'side': 'Long' if position.side > 0 else 'Short',
-                                    'entry_price': position.entry_price,
-                                    'current_price': position.current_price,
-                                    'quantity': position.quantity,
-                                    'take_profit': position.take_profit if position.take_profit else 0,
-                                    'stop_loss': position.stop_loss if position.stop_loss else 0,
-                                    'pnl': position.pnl if hasattr(position, 'pnl') else 0,
-                                    'timestamp': datetime.now()
-                                }
-                                self.positions.append(pos_dict)
-                            self.append_log(f"Synced {len(self.positions)} positions from MT4")
-                            self.update_positions_display()
-                    except Exception as e:
-                        self.append_log(f"Failed to sync positions from MT4: {e}")
-                else:
+                # Connect on the thread pool so the UI stays responsive
+                if not self.broker:
                     self.append_log("Failed to connect to broker")
                     QMessageBox.warning(self, "Connection Error", "Failed to connect to broker")
+                    return
+                
+                self.trading_controls_widget.connect_btn.setEnabled(False)
+                self.status_bar.showMessage("Connecting...")
+                self._start_worker(self.broker.connect, on_finished=self._on_connected,
+                                   on_error=self._on_connect_error, pool=self.order_pool)
             else:
                 # Disconnect - ask for confirmation
                 reply = QMessageBox.question(
@@ -1252,6 +1675,10 @@ class EnhancedMainWindow(QMainWindow):
                 if reply == QMessageBox.StandardButton.Cancel:
                     return  # User cancelled
                 
+                # Drop broker commands that have not started; the one in flight finishes first,
+                # so the closes and the disconnect queued below always run after it
+                self.order_pool.clear()
+                
                 # Stop trading and close positions if requested
                 if reply == QMessageBox.StandardButton.Yes:
                     if self.is_trading:
@@ -1262,17 +1689,130 @@ class EnhancedMainWindow(QMainWindow):
                 
                 # Disconnect
                 if self.broker:
-                    self.broker.disconnect()
-                self.is_connected = False
-                self.trading_status_widget.connection_status.setText("Disconnected")
-                self.trading_status_widget.connection_status.setStyleSheet("color: red; font-weight: bold;")
-                self.trading_controls_widget.update_connection_state(False)
-                self.append_log("Disconnected from broker")
-                self.status_bar.showMessage("Disconnected")
+                    self.trading_controls_widget.connect_btn.setEnabled(False)
+                    self._start_worker(self.broker.disconnect, on_finished=self._on_disconnected,
+                                       on_error=self._on_disconnect_error, pool=self.order_pool)
+                else:
+                    self._on_disconnected(None)
                 
         except Exception as e:
             self.append_log(f"Connection error: {str(e)}")
             QMessageBox.critical(self, "Error", f"Connection error: {str(e)}")
+    
+    def _start_worker(self, fn, *args, on_finished=None, on_error=None, pool=None):
+        """Run a blocking call on a thread pool (global by default), delivering results on the GUI thread."""
+        worker = BrokerWorker(fn, *args)
+        queued = Qt.ConnectionType.QueuedConnection
+        if on_finished is not None:
+            worker.signals.finished.connect(on_finished, queued)
+        worker.signals.error.connect(on_error if on_error is not None else self._on_worker_error, queued)
+        (pool or QThreadPool.globalInstance()).start(worker)
+        return worker
+    
+    def _on_worker_error(self, error):
+        """Log an error raised inside a pool worker."""
+        self.append_log(f"Background task error: {error}")
+    
+    def _on_connect_error(self, error):
+        """Handle an exception raised by broker.connect()."""
+        self.append_log(f"Connection error: {error}")
+        self._on_connected(False)
+    
+    def _on_connected(self, connected):
+        """Finish a connection attempt started by toggle_connection."""
+        if sip.isdeleted(self.trading_controls_widget):
+            return
+        self.trading_controls_widget.connect_btn.setEnabled(True)
+        
+        if not connected:
+            self.append_log("Failed to connect to broker")
+            self.status_bar.showMessage("Disconnected")
+            QMessageBox.warning(self, "Connection Error", "Failed to connect to broker")
+            return
+        
+        self.is_connected = True
+        self._schedule_tick()
+        self.trading_status_widget.connection_status.setText("Connected")
+        self.trading_status_widget.connection_status.setStyleSheet(_QSS_ACTIVE)
+        self.trading_controls_widget.update_connection_state(True)
+        self.append_log("Connected to broker successfully")
+        self.status_bar.showMessage("Connected")
+        
+        # Fetch balance and positions on the pool; the real-time sync waits until they are applied
+        self._account_sync_pending = True
+        self._start_worker(self._fetch_account, on_finished=self._on_account_fetched,
+                           on_error=self._on_account_fetch_error, pool=self.order_pool)
+    
+    def _fetch_account(self):
+        """Broker balance and positions, each as a (value, error) pair; runs on the order pool."""
+        results = []
+        for fetch in (self.broker.get_balance, self.broker.get_positions):
+            try:
+                results.append((fetch(), None))
+            except Exception as e:
+                results.append((None, e))
+        return results
+    
+    def _on_account_fetch_error(self, error):
+        """Handle an unexpected failure of the account fetch worker."""
+        self._account_sync_pending = False
+        self.append_log(f"Failed to sync account from MT4: {error}")
+    
+    def _show_broker_balance(self, balance):
+        """Show a broker-reported balance as balance and equity, formatting it once per change."""
+        if balance != self._broker_balance:
+            self._broker_balance = balance
+            self._broker_balance_text = f"${balance:,.2f}"
+        text = self._broker_balance_text
+        self.trading_status_widget.apply_snapshot({'balance_label': text, 'equity_label': text})
+        return text
+    
+    def _on_account_fetched(self, results):
+        """Apply the balance and positions fetched after connecting."""
+        self._account_sync_pending = False
+        if sip.isdeleted(self.trading_status_widget):
+            return
+        (real_balance, balance_error), (mt4_positions, positions_error) = results
+        
+        # Get real balance from MT4
+        if balance_error is not None:
+            self.append_log(f"Failed to get real balance: {balance_error}")
+        elif real_balance:
+            text = self._show_broker_balance(real_balance)
+            self.append_log(f"Real balance retrieved: {text}")
+        else:
+            self.append_log("Failed to get real balance: No response from MT4")
+        
+        # Sync positions from MT4
+        if positions_error is not None:
+            self.append_log(f"Failed to sync positions from MT4: {positions_error}")
+        elif mt4_positions:
+            try:
+                self._load_broker_positions(mt4_positions)
+                self.append_log(f"Synced {len(self.positions)} positions from MT4")
+                # Broker positions carry their own prices; show them without re-quoting each symbol
+                self._render_broker_positions()
+            except Exception as e:
+                self.append_log(f"Failed to sync positions from MT4: {e}")
+    
+    def _on_disconnect_error(self, error):
+        """Handle an exception raised by broker.disconnect()."""
+        self.append_log(f"Disconnect error: {error}")
+        self._on_disconnected(None)
+    
+    def _on_disconnected(self, _result):
+        """Finish a disconnect started by toggle_connection."""
+        if sip.isdeleted(self.trading_controls_widget):
+            return
+        self.is_connected = False
+        # A queued sync dropped by order_pool.clear() never reports back
+        self._account_sync_pending = False
+        self.trading_controls_widget.connect_btn.setEnabled(True)
+        self.trading_status_widget.connection_status.setText("Disconnected")
+        self.trading_status_widget.connection_status.setStyleSheet(_QSS_BOLD_RED)
+        self.trading_controls_widget.update_connection_state(False)
+        self.append_log("Disconnected from broker")
+        self.status_bar.showMessage("Disconnected")
             
     def toggle_trading(self):
         """Toggle trading state."""
@@ -1292,14 +1832,7 @@ class EnhancedMainWindow(QMainWindow):
                     return
                 
                 # Extract clean strategy name (remove emoji and risk level indicators)
-                clean_strategy_name = strategy_text
-                # Remove emoji prefixes
-                for emoji in ['🟢 ', '🟡 ', '🔴 ', '⚪ ']:
-                    if emoji in clean_strategy_name:
-                        clean_strategy_name = clean_strategy_name.replace(emoji, '')
-                # Remove risk level suffix in parentheses
-                if ' (' in clean_strategy_name:
-                    clean_strategy_name = clean_strategy_name.split(' (')[0]
+                clean_strategy_name = self._clean_strategy_name(strategy_text)
                 
                 # Initialize strategy
                 strategy = get_strategy(clean_strategy_name)
@@ -1313,8 +1846,9 @@ class EnhancedMainWindow(QMainWindow):
                 
                 # Start trading
                 self.is_trading = True
+                self._schedule_tick()
                 self.trading_status_widget.trading_status.setText("Running")
-                self.trading_status_widget.trading_status.setStyleSheet("color: green; font-weight: bold;")
+                self.trading_status_widget.trading_status.setStyleSheet(_QSS_ACTIVE)
                 self.trading_controls_widget.update_trading_state(True)
                 self.append_log(f"Started trading {clean_strategy_name} on {', '.join(symbols)}")
                 self.status_bar.showMessage("Trading Active")
@@ -1334,17 +1868,15 @@ class EnhancedMainWindow(QMainWindow):
         """Stop trading."""
         try:
             self.is_trading = False
+            self._trade_epoch += 1
             
-            # Stop timers
-            if hasattr(self, 'signal_timer'):
-                self.signal_timer.stop()
-            if hasattr(self, 'monitor_timer'):
-                self.monitor_timer.stop()
+            # The master timer stops dispatching signal generation once trading is off
+            self._signal_strategy = None
             
             self.trading_status_widget.trading_status.setText("Stopped")
-            self.trading_status_widget.trading_status.setStyleSheet("color: orange; font-weight: bold;")
+            self.trading_status_widget.trading_status.setStyleSheet(_QSS_BOLD_ORANGE)
             self.trading_controls_widget.update_trading_state(False)
-            self.append_log("Trading stopped - all timers stopped")
+            self.append_log("Trading stopped - signal generation halted")
             self.status_bar.showMessage("Trading Stopped")
             
         except Exception as e:
@@ -1359,23 +1891,43 @@ class EnhancedMainWindow(QMainWindow):
             
             self.append_log(f"Closing {len(self.positions)} open positions...")
             closed_count = 0
+            total = len(self.positions)
             
-            for position in self.positions[:]:  # Use slice to avoid modification during iteration
-                try:
-                    # Get current price for closing
-                    current_price = self.data_provider.get_latest_price(position['symbol'])
-                    if current_price:
-                        # Close the position
-                        self.close_position_from_signal(position['symbol'], current_price)
-                        closed_count += 1
-                        self.append_log(f"Closed position: {position['symbol']} {position['side']} at {current_price:.4f}")
-                    else:
-                        self.append_log(f"Warning: Could not get current price for {position['symbol']}")
-                except Exception as e:
-                    self.append_log(f"Error closing position {position['symbol']}: {str(e)}")
+            progress = QProgressDialog("Closing open positions...", None, 0, total, self)
+            progress.setWindowModality(Qt.WindowModality.WindowModal)
+            progress.setMinimumDuration(500)
+            
+            # Fetch closing prices for all symbols concurrently instead of one round-trip at a time
+            symbols = list(dict.fromkeys(position['symbol'] for position in self.positions))
+            executor = ThreadPoolExecutor(max_workers=min(8, len(symbols)))
+            try:
+                futures = {symbol: executor.submit(self.data_provider.get_latest_price, symbol) for symbol in symbols}
+                
+                # Walk backwards by index instead of copying the list; each close removes one
+                # entry at or before i, so the next index is always still in range
+                for n, i in enumerate(range(total - 1, -1, -1), start=1):
+                    position = self.positions[i]
+                    try:
+                        # Get current price for closing
+                        current_price = futures[position['symbol']].result(timeout=5)
+                        if current_price:
+                            # Close the position
+                            self.close_position_from_signal(position['symbol'], current_price)
+                            closed_count += 1
+                            self.append_log(f"Closed position: {position['symbol']} {position['side']} at {current_price:.4f}")
+                        else:
+                            self.append_log(f"Warning: Could not get current price for {position['symbol']}")
+                    except Exception as e:
+                        self.append_log(f"Error closing position {position['symbol']}: {str(e)}")
+                    progress.setValue(n)
+            finally:
+                # Don't wait on a price request that timed out
+                executor.shutdown(wait=False)
             
             # Clear positions list
             self.positions.clear()
+            self._reindex_positions()
+            self._dirty.add('positions')
             self.open_positions_widget.update_positions(self.positions, {})
             self.append_log(f"Successfully closed {closed_count} positions")
             
@@ -1387,15 +1939,10 @@ class EnhancedMainWindow(QMainWindow):
         try:
             self.append_log(f"Signal generation started for {strategy.name}")
             
-            # Start real-time signal generation timer (less frequent to prevent freezing)
-            self.signal_timer = QTimer()
-            self.signal_timer.timeout.connect(lambda: self.generate_signals(strategy, symbols))
-            self.signal_timer.start(300000)  # Check every 5 minutes (more frequent)
-            
-            # Start monitoring timer (less frequent)
-            self.monitor_timer = QTimer()
-            self.monitor_timer.timeout.connect(self.monitor_trading_activity)
-            self.monitor_timer.start(2000)  # Update every 2 seconds (reduced frequency)
+            # Signals are generated every SIGNAL_EVERY_TICKS master ticks (~5 minutes)
+            self._signal_strategy = strategy
+            self._signal_symbols = symbols
+            self._signal_ticks = 0
             
             self.append_log("Real-time signal generation active - monitoring markets...")
             
@@ -1415,149 +1962,180 @@ class EnhancedMainWindow(QMainWindow):
                 
             # Process only a few symbols at a time to prevent blocking
             symbols_to_process = symbols[:3]  # Limit to 3 symbols per cycle
+            data_interval = self.settings_manager.get('data_interval', '1h')
             
-            for symbol in symbols_to_process:
-                try:
-                    # Check cooldown period (5 minutes between signals for same symbol)
-                    current_time = datetime.now()
-                    if symbol in self.signal_cooldown:
-                        time_since_last = (current_time - self.signal_cooldown[symbol]).total_seconds()
-                        if time_since_last < 600:  # 10 minute cooldown
-                            continue
-                    
-                    # Get current price (simplified to prevent blocking)
-                    current_price = self.data_provider.get_latest_price(symbol)
-                    if current_price is None:
-                        continue
-                    
-                    # Generate proper strategy signal
-                    signal = self.generate_strategy_signal(strategy, symbol, current_price)
-                    
-                    if signal != 0:
-                        # Update cooldown
-                        self.signal_cooldown[symbol] = current_time
-                        
-                        self.append_log(f"[{symbol}] Signal: {'BUY' if signal > 0 else 'SELL'} at {current_price:.4f}")
-                        
-                        # Record signal with monitor
-                        clean_strategy_name = self._get_current_strategy_name()
-                        if clean_strategy_name:
-                            import time as time_module
-                            start_time = time_module.time()
-                            self.strategy_monitor.record_signal(clean_strategy_name, execution_time=0.0)
-                        
-                        # Check if live trade confirmation is required
-                        if self.settings_manager.get('confirm_live_trades', True):
-                            # Show confirmation dialog
-                            if not self.show_trade_confirmation(symbol, signal, current_price):
-                                self.append_log(f"Trade cancelled by user for {symbol}")
-                                continue
-                        
-                        # Create actual position when signal is generated
-                        self.create_position_from_signal(symbol, signal, current_price)
-                        
-                        # Use cooldown mechanism instead of blocking sleep for fast execution
-                        # Cooldown is checked at the start of the loop, no blocking here
-                    
-                except Exception as e:
-                    self.append_log(f"Error processing {symbol}: {str(e)}")
-                    # Record error with monitor
-                    clean_strategy_name = self._get_current_strategy_name()
-                    if clean_strategy_name:
-                        self.strategy_monitor.record_error(clean_strategy_name, str(e))
+            for symbol in self._eligible_symbols(symbols_to_process, monotonic()):
+                # Fetch the price and evaluate the strategy off the GUI thread
+                worker = SignalWorker(self.generate_strategy_signal, strategy, symbol, data_interval, self._trade_epoch)
+                worker.signals.signal_ready.connect(self._on_signal_ready, Qt.ConnectionType.QueuedConnection)
+                worker.signals.error.connect(self._on_symbol_error, Qt.ConnectionType.QueuedConnection)
+                self.signal_pool.start(worker)
                     
         except Exception as e:
             self.append_log(f"Signal generation error: {str(e)}")
             # Record error with monitor
             clean_strategy_name = self._get_current_strategy_name()
             if clean_strategy_name:
-                self.strategy_monitor.record_error(clean_strategy_name, str(e))
+                self._record_strategy_error(clean_strategy_name, str(e))
+    
+    def _eligible_symbols(self, symbols, now):
+        """Symbols whose last signal is at least SIGNAL_COOLDOWN_S seconds old (or that never signalled)."""
+        cutoff = now - self.SIGNAL_COOLDOWN_S
+        last = self.signal_cooldown.get
+        return [symbol for symbol in symbols if last(symbol, cutoff) <= cutoff]
+    
+    def _on_signal_ready(self, symbol, signal, current_price, epoch):
+        """Queue a non-zero strategy signal computed by a SignalWorker."""
+        # Drop results from workers dispatched before trading was last stopped
+        if signal == 0 or not self._is_current_epoch(epoch):
+            return
+        
+        # Update cooldown
+        self.signal_cooldown[symbol] = monotonic()
+        
+        self._pending_signals.append((symbol, signal, current_price, epoch))
+        if not self._draining:
+            self._drain_pending()
+    
+    def _drain_pending(self):
+        """Execute one queued signal, then schedule the next one second later."""
+        if not self._pending_signals:
+            self._draining = False
+            return
+        self._draining = True
+        symbol, signal, current_price, epoch = self._pending_signals.popleft()
+        try:
+            if self._is_current_epoch(epoch):
+                self.append_log(f"[{symbol}] Signal: {'BUY' if signal > 0 else 'SELL'} at {current_price:.4f}")
+                
+                # Record signal with monitor
+                clean_strategy_name = self._get_current_strategy_name()
+                if clean_strategy_name:
+                    self.strategy_monitor.record_signal(clean_strategy_name, execution_time=0.0)
+                
+                # Check if live trade confirmation is required
+                if (self.settings_manager.get('confirm_live_trades', True)
+                        and not self.show_trade_confirmation(symbol, signal, current_price)):
+                    self.append_log(f"Trade cancelled by user for {symbol}")
+                else:
+                    # Create actual position when signal is generated
+                    self.create_position_from_signal(symbol, signal, current_price)
+        except Exception as e:
+            self._on_symbol_error(symbol, str(e))
+        
+        # Space out consecutive trades without blocking the event loop
+        QTimer.singleShot(1000, self._drain_pending)
+    
+    def _is_current_epoch(self, epoch):
+        """True while trading is on and no stop has happened since epoch was captured."""
+        return self.is_trading and epoch == self._trade_epoch
+    
+    def _on_symbol_error(self, symbol, error):
+        """Log and record an error raised while processing a symbol."""
+        self.append_log(f"Error processing {symbol}: {error}")
+        # Record error with monitor
+        clean_strategy_name = self._get_current_strategy_name()
+        if clean_strategy_name:
+            self._record_strategy_error(clean_strategy_name, error)
+    
+    def _record_strategy_error(self, strategy_name, error):
+        """Record a strategy error with the monitor; a missing monitoring backend is not an error here."""
+        try:
+            self.strategy_monitor.record_error(strategy_name, error)
+        except ImportError:
+            pass
+    
+    @classmethod
+    def _clean_strategy_name(cls, strategy_text):
+        """Strip the ' (Risk)' suffix from a strategy combo entry."""
+        return strategy_text.partition(' (')[0].strip()
     
     def _get_current_strategy_name(self):
         """Get the current strategy name from the UI."""
         try:
             strategy_text = self.strategy_config_widget.strategy_combo.currentText()
-            clean_strategy_name = strategy_text
-            # Remove emoji prefixes
-            for emoji in ['🟢 ', '🟡 ', '🔴 ', '⚪ ']:
-                if emoji in clean_strategy_name:
-                    clean_strategy_name = clean_strategy_name.replace(emoji, '')
-            # Remove risk level suffix in parentheses
-            if ' (' in clean_strategy_name:
-                clean_strategy_name = clean_strategy_name.split(' (')[0]
-            return clean_strategy_name
+            return self._clean_strategy_name(strategy_text)
         except Exception:
             return None
     
-    def generate_strategy_signal(self, strategy, symbol, current_price):
-        """Generate trading signal using the selected strategy."""
-        try:
-            # Get historical data for the symbol using user's data interval setting
-            data_interval = self.settings_manager.get('data_interval', '1h')
-            historical_data = self.data_provider.get_historical_data(symbol, period='1d', interval=data_interval)
-            if historical_data is None or len(historical_data) < 20:
-                return 0
-            
-            # Convert to DataFrame if needed
-            if hasattr(historical_data, 'to_pandas'):
-                df = historical_data.to_pandas()
-            else:
-                df = historical_data
-            
-            # Ensure we have the required columns
-            required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-            if not all(col in df.columns for col in required_columns):
-                return 0
-            
-            # Add current price as the latest data point
-            import pandas as pd
-            current_row = pd.DataFrame({
-                'Open': [current_price],
-                'High': [current_price],
-                'Low': [current_price],
-                'Close': [current_price],
-                'Volume': [1000]
-            }, index=[df.index[-1] + pd.Timedelta(hours=1)])
-            
-            df = pd.concat([df, current_row])
-            
+    def generate_strategy_signal(self, strategy, symbol, data_interval, epoch):
+        """Generate trading signal using the selected strategy.
+        
+        Runs on a SignalWorker thread, so it must not touch any widgets.
+        Returns a (signal, price) tuple; price is None when no quote is available
+        or trading was stopped while the work was in flight.
+        """
+        if not self._is_current_epoch(epoch):
+            return 0, None
+        current_price = self._get_price_cached(symbol)
+        if current_price is None or not self._is_current_epoch(epoch):
+            return 0, None
+        
+        df = self._get_cached_history(symbol, data_interval)
+        if df is None:
+            return 0, current_price
+        
+        # Overwrite the reserved live-quote row in place instead of concatenating a new frame
+        df.iloc[-1, self._ohlcv_positions(df)] = [current_price, current_price, current_price, current_price, 1000]
+        
+        # Price fetches run in parallel; the shared strategy instance is evaluated by one worker at a time
+        with self._strategy_lock:
             # Calculate indicators first
             df = strategy.indicators(df)
+            if not self._is_current_epoch(epoch):
+                return 0, None
             
             # Check if required indicators exist after calculation
             # Different strategies have different required indicators
-            strategy_name = strategy.name if hasattr(strategy, 'name') else str(type(strategy).__name__)
-            
-            # Define required indicators for each strategy
-            required_indicators = {
-                'ML Adaptive SuperTrend': ['SuperTrend', 'Direction'],
-                'Adaptive Trend Flow': ['Trend_Flow', 'Signal_Strength'],
-                'SMA Crossover': ['SMA_fast', 'SMA_slow'],
-                'Breakout ATR': ['ATR', 'Breakout_High', 'Breakout_Low'],
-                'RSI Reversion': ['RSI', 'ATR'],
-                'Scalping MA': ['EMA_Fast', 'EMA_Medium', 'EMA_Slow'],
-                'News Trading': ['Volatility', 'ATR', 'Breakout_High'],
-                'Momentum Breakout': ['Momentum', 'ATR', 'Breakout_High'],
-                'Mean Reversion': ['RSI', 'ATR', 'BB_Upper']
-            }
-            
-            # Get required indicators for this strategy
-            strategy_indicators = required_indicators.get(strategy_name, [])
-            
-            # Check if any required indicators are missing
-            missing_indicators = [ind for ind in strategy_indicators if ind not in df.columns]
+            strategy_name = getattr(strategy, 'name', type(strategy).__name__)
+            missing_indicators = _REQUIRED_INDICATORS.get(strategy_name, frozenset()) - frozenset(df.columns)
             if missing_indicators:
-                self.append_log(f"Warning: Required indicators not calculated for {symbol}: {missing_indicators}")
-                return 0
+                raise ValueError(f"Required indicators not calculated: {sorted(missing_indicators)}")
             
             # Generate signal using the strategy
             signal = strategy.signal(df)
-            
-            return signal
-            
-        except Exception as e:
-            self.append_log(f"Error generating strategy signal for {symbol}: {str(e)}")
-            return 0
+        
+        return signal, current_price
+    
+    def _get_cached_history(self, symbol, data_interval):
+        """Return the cached history frame for a symbol, re-fetching once per bar interval."""
+        key = (symbol, data_interval)
+        now = datetime.now()
+        last_fetch = self._hist_last_fetch.get(key)
+        refresh_secs = self.INTERVAL_SECONDS.get(data_interval, 3600)
+        if key in self._hist_cache and (now - last_fetch).total_seconds() < refresh_secs:
+            return self._hist_cache[key]
+        
+        # Get historical data for the symbol using user's data interval setting
+        historical_data = self.data_provider.get_historical_data(symbol, period='1d', interval=data_interval)
+        if historical_data is None or len(historical_data) < 20:
+            return None
+        
+        # Convert to DataFrame if needed
+        if hasattr(historical_data, 'to_pandas'):
+            df = historical_data.to_pandas()
+        else:
+            df = historical_data
+        
+        # Ensure we have the required columns
+        required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+        if not all(col in df.columns for col in required_columns):
+            return None
+        
+        # Bound the window and reserve one trailing row for the live quote
+        df = df.tail(self.HIST_WINDOW)
+        live_row = df.iloc[[-1]].copy()
+        live_row.index = [df.index[-1] + pd.Timedelta(hours=1)]
+        df = pd.concat([df, live_row])
+        
+        self._hist_cache[key] = df
+        self._hist_last_fetch[key] = now
+        return df
+    
+    @staticmethod
+    def _ohlcv_positions(df):
+        """Column positions of the OHLCV columns in a history frame."""
+        return [df.columns.get_loc(col) for col in ('Open', 'High', 'Low', 'Close', 'Volume')]
     
     def calculate_position_size(self, entry_price, signal):
         """Calculate position size based on risk management from settings."""
@@ -1577,38 +2155,13 @@ class EnhancedMainWindow(QMainWindow):
             
             # CRITICAL FIX: Position sizing should be extremely conservative
             # The user's max_trade_amount should be respected as the absolute maximum
-            
-            # Calculate risk-based position size (very conservative)
-            risk_amount = current_balance * base_risk_pct
-            
-            # Apply leverage but cap it for safety
-            max_safe_leverage = min(leverage, 3)  # Cap leverage at 3x for safety
-            leveraged_risk = risk_amount * max_safe_leverage
-            
-            # Convert to micro lots (1 micro lot = 1,000 units)
-            # Use a very conservative conversion: 1 micro lot per $100 of risk
-            risk_based_micro_lots = max(1, int(leveraged_risk / 100))  # At least 1 micro lot
-            risk_based_units = risk_based_micro_lots * 1000  # Convert to units
-            
-            # Apply user's max trade amount limit (this is the critical limit)
-            # Convert max_trade_amount to units (assuming 1 unit = $1)
-            max_size_units = int(max_trade_amount)  # $150 = 150 units maximum
-            
-            # Use the smaller of risk-based size or max trade amount
-            position_size_units = min(risk_based_units, max_size_units)
-            
-            # CRITICAL: Ensure we never exceed 50 units for safety
-            position_size_units = min(position_size_units, 50)
-            
-            # Apply minimum trade amount
-            min_size_units = int(min_trade_amount)  # $10 minimum
-            position_size_units = max(min_size_units, position_size_units)
-            
-            # Final safety check - never exceed 1,000 units (1 micro lot) for safety
-            position_size_units = min(position_size_units, 1000)
+            position_size_units = int(_size_kernel(
+                float(current_balance), float(base_risk_pct), float(leverage),
+                float(min_trade_amount), float(max_trade_amount)
+            ))
             
             # Debug logging
-            self.append_log(f"Position Size Debug - Balance: ${current_balance:.2f}, Risk: {base_risk_pct*100:.2f}%, Leverage: {leverage}x, Max Trade: ${max_trade_amount}, Units: {position_size_units}")
+            self._dlog(lambda: f"Position Size Debug - Balance: ${current_balance:.2f}, Risk: {base_risk_pct*100:.2f}%, Leverage: {leverage}x, Max Trade: ${max_trade_amount}, Units: {position_size_units}")
             
             return position_size_units
             
@@ -1616,6 +2169,122 @@ class EnhancedMainWindow(QMainWindow):
             self.append_log(f"Error calculating position size: {str(e)}")
             return 1000  # Default fallback (1 micro lot)
     
+    def _reindex_positions(self):
+        """Rebuild the symbol index, open PnL total and open-time array after self.positions changes."""
+        index = {}
+        open_pnl = 0.0
+        opened = np.full(len(self.positions), np.nan)
+        for i, pos in enumerate(self.positions):
+            index.setdefault(pos.get('symbol'), []).append(i)
+            open_pnl += pos.get('pnl', 0)
+            ts = pos.get('ts_epoch')
+            if ts is not None:
+                opened[i] = ts
+        self._positions_by_symbol = index
+        self._open_pnl = open_pnl
+        self._opened_epochs = opened
+        self._position_cols = None
+    
+    def _load_broker_positions(self, broker_positions):
+        """Replace self.positions with the broker's Position objects, converted to position dicts."""
+        synced_at = datetime.now()
+        synced_epoch = synced_at.timestamp()
+        self.positions = [{
+            'symbol': position.symbol,
+            'side': 'Long' if position.side > 0 else 'Short',
+            'entry_price': position.entry_price,
+            'current_price': position.current_price,
+            'quantity': position.quantity,
+            'take_profit': position.take_profit if position.take_profit else 0,
+            'stop_loss': position.stop_loss if position.stop_loss else 0,
+            'pnl': position.pnl if hasattr(position, 'pnl') else 0,
+            'timestamp': synced_at,
+            'ts_epoch': synced_epoch
+        } for position in broker_positions.values()]
+        self._reindex_positions()
+        # The display columns come straight from the broker's Position objects
+        self._position_cols = PositionArray.from_positions(list(broker_positions.values()))
+    
+    def _position_columns(self):
+        """Column (PositionArray) view of self.positions, built once per change to the list."""
+        cols = self._position_cols
+        if cols is None:
+            positions = self.positions
+            n = len(positions)
+            cols = self._position_cols = PositionArray(
+                symbols=np.array([pos['symbol'] for pos in positions], dtype=object),
+                sides=np.fromiter((1 if pos['side'] == 'Long' else -1 for pos in positions), dtype=np.int8, count=n),
+                quantity=np.fromiter((pos.get('quantity', 1.0) for pos in positions), dtype=float, count=n),
+                entry_price=np.fromiter((pos['entry_price'] for pos in positions), dtype=float, count=n),
+                current_price=np.fromiter((pos.get('current_price', pos['entry_price']) for pos in positions),
+                                          dtype=float, count=n),
+                stop_loss=np.fromiter((pos.get('stop_loss') or np.nan for pos in positions), dtype=float, count=n),
+                take_profit=np.fromiter((pos.get('take_profit') or np.nan for pos in positions), dtype=float, count=n),
+            )
+        return cols
+    
+    def _remove_position(self, i):
+        """Swap-and-pop position i, patching the symbol index and totals instead of reindexing."""
+        positions = self.positions
+        removed = positions[i]
+        last = len(positions) - 1
+        index = self._positions_by_symbol
+        
+        indices = index[removed.get('symbol')]
+        indices.remove(i)
+        if not indices:
+            del index[removed.get('symbol')]
+        
+        if i != last:
+            # Move the tail position into the hole; its index list keeps its open order
+            moved = positions[last]
+            positions[i] = moved
+            moved_indices = index[moved.get('symbol')]
+            moved_indices[moved_indices.index(last)] = i
+            self._opened_epochs[i] = self._opened_epochs[last]
+        positions.pop()
+        self._opened_epochs = self._opened_epochs[:last]
+        self._open_pnl -= removed.get('pnl', 0)
+        self._position_cols = None
+    
+    def _dlog(self, msg_factory):
+        """Log a diagnostic message, building it only when debug logging is enabled."""
+        if self.debug_logging:
+            self.append_log(msg_factory())
+    
+    def _position_index(self, symbol):
+        """Index of the oldest open position for a symbol, or None."""
+        indices = self._positions_by_symbol.get(symbol)
+        return indices[0] if indices else None
+    
+    def _record_closed_trade(self, trade):
+        """Append a closed trade and fold it into the running totals and daily ring buffer."""
+        self.closed_trades.append(trade)
+        self._dirty.add('metrics')
+        
+        agg = self._agg
+        agg['count'] += 1
+        agg['closed_pnl'] += trade.pnl
+        if trade.pnl > 0:
+            agg['wins'] += 1
+            agg['gross_profit'] += trade.pnl
+        elif trade.pnl < 0:
+            agg['gross_loss'] -= trade.pnl
+        
+        # Use exit_time if available, otherwise fall back to entry_time
+        trade_time = trade.exit_time or trade.entry_time
+        if not trade_time:
+            return
+        ordinal = trade_time.date().toordinal()
+        idx = ordinal % 32
+        if self._daily_ordinal[idx] != ordinal:
+            # Slot still holds an older day; recycle it
+            self._daily_ordinal[idx] = ordinal
+            self._daily_counts[idx] = 0
+            self._daily_pnl[idx] = 0.0
+        self._daily_counts[idx] += 1
+        self._daily_pnl[idx] += trade.pnl
+    
     def check_daily_trade_limits(self):
         """Check if daily trade limits have been reached."""
         try:
@@ -1631,8 +2300,6 @@ class EnhancedMainWindow(QMainWindow):
             
             # Calculate today's PnL and trade count from closed trades
             today = datetime.now().date()
-            today_pnl = 0.0
-            today_trade_count = 0
             
             # Reset daily counter if it's a new day
             if self.last_trade_date != today:
@@ -1640,36 +2307,27 @@ class EnhancedMainWindow(QMainWindow):
                 self.last_trade_date = today
                 self.append_log(f"New trading day: {today}")
             
-            # Count closed trades - use exit_time if available, otherwise use entry_time
-            for trade in self.closed_trades:
-                trade_date = None
-                if hasattr(trade, 'exit_time') and trade.exit_time:
-                    trade_date = trade.exit_time.date()
-                elif hasattr(trade, 'entry_time') and trade.entry_time:
-                    trade_date = trade.entry_time.date()
-                elif hasattr(trade, 'timestamp') and trade.timestamp:
-                    trade_date = trade.timestamp.date()
-                
-                if trade_date == today:
-                    today_pnl += trade.pnl
-                    today_trade_count += 1
-            
-            # Count open positions (trades opened today) - use entry_time if available
-            for position in self.positions:
-                position_date = None
-                if 'timestamp' in position and position['timestamp']:
-                    position_date = position['timestamp'].date()
-                elif 'entry_time' in position and position['entry_time']:
-                    position_date = position['entry_time'].date()
-                
-                if position_date == today:
-                    today_trade_count += 1
+            # Today's closed trades come straight from the daily ring buffer
+            today_ordinal = today.toordinal()
+            idx = today_ordinal % 32
+            if self._daily_ordinal[idx] == today_ordinal:
+                today_pnl = float(self._daily_pnl[idx])
+                today_trade_count = int(self._daily_counts[idx])
+            else:
+                today_pnl = 0.0
+                today_trade_count = 0
+            
+            # Count open positions (trades opened today) from the open-time array kept by _reindex_positions
+            today_start = datetime.combine(today, datetime.min.time()).timestamp()
+            tomorrow_start = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+            opened = self._opened_epochs
+            today_trade_count += int(np.count_nonzero((opened >= today_start) & (opened < tomorrow_start)))
             
             # Use the higher of the two counts (daily counter vs calculated count)
             actual_trade_count = max(self.daily_trade_count, today_trade_count)
             
             # Debug logging for trade counting
-            self.append_log(f"Trade Count Debug - Today: {actual_trade_count}, Max: {max_trades_per_day}, Daily Counter: {self.daily_trade_count}, Calculated: {today_trade_count}")
+            self._dlog(lambda: f"Trade Count Debug - Today: {actual_trade_count}, Max: {max_trades_per_day}, Daily Counter: {self.daily_trade_count}, Calculated: {today_trade_count}")
             
             # Check if max trades per day exceeded
             if actual_trade_count >= max_trades_per_day:
@@ -1719,6 +2377,7 @@ class EnhancedMainWindow(QMainWindow):
         try:
             # Reinitialize data provider with updated settings
             self.data_provider = MultiProvider(settings_manager=self.settings_manager)
+            self._price_cache.clear()
             self.append_log("Data provider refreshed with updated settings")
             
             # Update trading controller with new data provider
@@ -1730,26 +2389,18 @@ class EnhancedMainWindow(QMainWindow):
     
     def _extract_leverage(self, leverage_text):
         """Extract leverage number from UI text."""
-        try:
-            # Extract number from text like "1:10 (Moderate)"
-            if "1:" in leverage_text:
-                parts = leverage_text.split("1:")
-                if len(parts) > 1:
-                    leverage_part = parts[1].split(" ")[0]
-                    return float(leverage_part)
-            return 1.0  # Default leverage
-        except Exception:
-            return 1.0
+        # Extract number from text like "1:10 (Moderate)"
+        return _parse_leverage(leverage_text or "")
     
     def _get_current_balance(self):
         """Get current balance from portfolio."""
         try:
-            # Get real balance from MT4 broker
-            if self.broker and self.broker.is_connected():
-                base_balance = self.broker.get_balance()
+            # Last balance synced from MT4 on the order pool; no broker round-trip here
+            if self.broker and self.broker.is_connected() and self._broker_balance is not None:
+                base_balance = self._broker_balance
             else:
                 base_balance = 10000.0
-            closed_pnl = sum(trade.pnl for trade in self.closed_trades)
+            closed_pnl = self._agg['closed_pnl']
             return base_balance + closed_pnl
         except Exception:
             return 10000.0
@@ -1758,11 +2409,8 @@ class EnhancedMainWindow(QMainWindow):
         """Create a position from a trading signal."""
         try:
             # Check if we already have a position for this symbol
-            existing_position = None
-            for pos in self.positions:
-                if pos.get('symbol') == symbol:
-                    existing_position = pos
-                    break
+            idx = self._position_index(symbol)
+            existing_position = self.positions[idx] if idx is not None else None
             
             if existing_position:
                 # Check if portfolio mode is enabled
@@ -1773,8 +2421,8 @@ class EnhancedMainWindow(QMainWindow):
                     self.append_log(f"Portfolio mode: Adding additional position for {symbol}")
                 else:
                     # Evaluate closing existing position on opposite signal with net PnL guard
-                    import random
-                    price_variation = random.uniform(-0.001, 0.001) * price  # 0.1% variation
+                    price_variation = self._jitter[self._jitter_i & 0xFFFF] * price  # 0.1% variation
+                    self._jitter_i += 1
                     exit_price = price + price_variation
 
                     # Calculate hypothetical PnL including spread
@@ -1805,143 +2453,188 @@ class EnhancedMainWindow(QMainWindow):
                         self.append_log(f"Skipping close for {symbol}: PnL would be {hypothetical_pnl:.2f} (too negative)")
                         return
             
-            # Use real price from MT4 broker
-            if self.broker and self.broker.is_connected():
-                real_price = self.broker.get_price(symbol)
-                if real_price is not None:
-                    entry_price = real_price
-                    self.append_log(f"Using real MT4 price for {symbol}: {entry_price}")
-                else:
-                    entry_price = price
-                    self.append_log(f"Using data provider price for {symbol}: {entry_price}")
-            else:
-                entry_price = price
-                self.append_log(f"Using data provider price for {symbol}: {entry_price}")
-            
-            # Calculate position size
-            quantity = self.calculate_position_size(entry_price, signal)
-            take_profit = entry_price * (1.02 if signal > 0 else 0.98)  # 2% take profit
-            stop_loss = entry_price * (0.98 if signal > 0 else 1.02)  # 2% stop loss
-            
-            # Submit order to broker (MT4)
-            if self.broker and self.broker.is_connected():
-                order_id = self.broker.submit_order(
-                    symbol=symbol,
-                    side=1 if signal > 0 else -1,  # 1 for buy, -1 for sell
-                    quantity=quantity,
-                    stop_loss=stop_loss,
-                    take_profit=take_profit
-                )
-                
-                if order_id:
-                    self.append_log(f"Order submitted to MT4: {order_id} for {symbol}")
-                    # Use QTimer.singleShot for non-blocking delay instead of sleep
-                    # This allows UI to remain responsive while waiting for MT4
-                    from PyQt6.QtCore import QTimer
-                    QTimer.singleShot(1500, lambda: self._sync_mt4_position_after_order(symbol, order_id))
-                    # Continue immediately without blocking - position will be synced async
-                    return
-                else:
-                    self.append_log(f"Failed to submit order to MT4 for {symbol}")
-            else:
+            if not (self.broker and self.broker.is_connected()):
                 self.append_log(f"Broker not connected - cannot submit order for {symbol}")
+                return
+            
+            # Size the order here (it reads leverage from the UI); quote and submit on the order pool
+            quantity = self.calculate_position_size(price, signal)
+            self._start_worker(
+                self._submit_order, symbol, signal, price, quantity, self._trade_epoch,
+                on_finished=functools.partial(self._on_order_submitted, symbol),
+                on_error=functools.partial(self._on_order_error, symbol),
+                pool=self.order_pool
+            )
         except Exception as e:
             self.append_log(f"Error creating position: {str(e)}")
     
+    def _submit_order(self, symbol, signal, price, quantity, epoch):
+        """Quote and submit an order to the broker; runs on the order pool, not the GUI thread.
+        
+        Returns None without submitting when trading was stopped after the order was queued.
+        """
+        if epoch != self._trade_epoch:
+            return None
+        
+        # Use real price from MT4 broker
+        real_price = self.broker.get_price(symbol)
+        entry_price = real_price if real_price is not None else price
+        
+        take_profit = entry_price * (1.02 if signal > 0 else 0.98)  # 2% take profit
+        stop_loss = entry_price * (0.98 if signal > 0 else 1.02)  # 2% stop loss
+        
+        # Trading may have stopped while the quote was in flight
+        if epoch != self._trade_epoch:
+            return None
+        
+        # Submit order to broker (MT4)
+        order_id = self.broker.submit_order(
+            symbol=symbol,
+            side=1 if signal > 0 else -1,  # 1 for buy, -1 for sell
+            quantity=quantity,
+            stop_loss=stop_loss,
+            take_profit=take_profit
+        )
+        return order_id, entry_price, real_price is not None
+    
+    def _on_order_submitted(self, symbol, result):
+        """Log the outcome of an order submitted by _submit_order."""
+        if result is None:
+            self.append_log(f"Dropped queued order for {symbol}: trading was stopped")
+            return
+        order_id, entry_price, from_broker = result
+        if from_broker:
+            self.append_log(f"Using real MT4 price for {symbol}: {entry_price}")
+        else:
+            self.append_log(f"Using data provider price for {symbol}: {entry_price}")
+        
+        if order_id:
+            self.append_log(f"Order submitted to MT4: {order_id} for {symbol}")
+            # Give MT4 time to open the position before syncing it back
+            QTimer.singleShot(1500, functools.partial(self._sync_mt4_position_after_order, symbol, order_id))
+        else:
+            self.append_log(f"Failed to submit order to MT4 for {symbol}")
+    
+    def _on_order_error(self, symbol, error):
+        """Handle an exception raised while submitting an order."""
+        self.append_log(f"Error creating position: {error}")
+    
     def _sync_mt4_position_after_order(self, symbol: str, order_id: str):
         """Sync MT4 position after order submission (non-blocking callback)."""
-        try:
+        if self.broker and self.broker.is_connected():
             # Sync positions from MT4 to get the actual order details
-            if self.broker and self.broker.is_connected():
-                mt4_positions = self.broker.get_positions()
-                if mt4_positions and symbol in mt4_positions:
-                    mt4_pos = mt4_positions[symbol]
-                    # Use actual MT4 entry price, SL, and TP
-                    entry_price = mt4_pos.entry_price
-                    stop_loss = mt4_pos.stop_loss if mt4_pos.stop_loss else None
-                    take_profit = mt4_pos.take_profit if mt4_pos.take_profit else None
-                    quantity = mt4_pos.quantity  # Use actual quantity from MT4
-                    self.append_log(f"MT4 order confirmed: {symbol} at {entry_price:.4f}, SL={stop_loss:.4f if stop_loss else 'None'}, TP={take_profit:.4f if take_profit else 'None'}")
-                else:
-                    self.append_log(f"Warning: Order submitted but position not found in MT4 yet for {symbol}")
+            self._start_worker(self.broker.get_positions,
+                               on_finished=functools.partial(self._on_order_positions, symbol),
+                               on_error=self._on_order_verify_error, pool=self.order_pool)
+        else:
+            self.append_log(f"Broker not connected - cannot verify order for {symbol}")
+    
+    def _on_order_positions(self, symbol, mt4_positions):
+        """Confirm an order against the positions MT4 reported after it was submitted."""
+        try:
+            if mt4_positions and symbol in mt4_positions:
+                mt4_pos = mt4_positions[symbol]
+                # Use actual MT4 entry price, SL, and TP
+                entry_price = mt4_pos.entry_price
+                stop_loss = mt4_pos.stop_loss if mt4_pos.stop_loss else None
+                take_profit = mt4_pos.take_profit if mt4_pos.take_profit else None
+                quantity = mt4_pos.quantity  # Use actual quantity from MT4
+                self.append_log(f"MT4 order confirmed: {symbol} at {entry_price:.4f}, SL={stop_loss:.4f if stop_loss else 'None'}, TP={take_profit:.4f if take_profit else 'None'}")
             else:
-                self.append_log(f"Broker not connected - cannot verify order for {symbol}")
+                self.append_log(f"Warning: Order submitted but position not found in MT4 yet for {symbol}")
         except Exception as e:
             self.append_log(f"Warning: Could not verify order in MT4: {e}")
     
+    def _on_order_verify_error(self, error):
+        """Handle an exception raised while reading positions to verify an order."""
+        self.append_log(f"Warning: Could not verify order in MT4: {error}")
+    
     def close_position_from_signal(self, symbol, price):
         """Close a position from a trading signal."""
         try:
-            for i, pos in enumerate(self.positions):
-                if pos.get('symbol') == symbol:
-                    # Use the actual price for more realistic PnL calculation
-                    exit_price = price
-                    
-                    # Calculate PnL with very conservative approach
-                    # Use micro lots for calculation (1 micro lot = 1,000 units)
-                    micro_lots = pos['quantity'] / 1000
-                    
-                    # Get broker spread from settings
-                    broker_spread_pips = self.settings_manager.get('broker_spread', 2.0)  # Default 2 pips
-                    spread_cost = broker_spread_pips * micro_lots * 10  # $10 per pip per micro lot
-                    
-                    if pos['side'] == 'Long':
-                        pnl = (exit_price - pos['entry_price']) * micro_lots * 10  # $10 per pip per micro lot
-                    else:
-                        pnl = (pos['entry_price'] - exit_price) * micro_lots * 10  # $10 per pip per micro lot
-                    
-                    # Deduct broker spread cost
-                    pnl -= spread_cost
-                    
-                    # Debug PnL calculation
-                    self.append_log(f"PnL Debug - {symbol}: Entry={pos['entry_price']:.4f}, Exit={exit_price:.4f}, Qty={pos['quantity']:.2f}, Spread={spread_cost:.2f}, PnL={pnl:.2f}")
-                    
-                    # Close order in MT4
-                    if self.broker and self.broker.is_connected() and 'order_id' in pos:
-                        close_success = self.broker.close_all(symbol)
-                        if close_success:
-                            self.append_log(f"Order closed in MT4 for {symbol}")
-                        else:
-                            self.append_log(f"Failed to close order in MT4 for {symbol}")
-                    
-                    # Create closed trade as Trade object
-                    trade = Trade(
-                        symbol=symbol,
-                        side=1 if pos['side'] == 'Long' else -1,  # Convert to numeric
-                        quantity=pos['quantity'],
-                        entry_price=pos['entry_price'],
-                        exit_price=exit_price,
-                        pnl=pnl,
-                        strategy='ML_Adaptive_SuperTrend',
-                        entry_time=pos['timestamp'],
-                        exit_time=datetime.now(),
-                        take_profit=pos.get('take_profit'),
-                        stop_loss=pos.get('stop_loss'),
-                        management_notes='Signal Close'
-                    )
-                    
-                    self.closed_trades.append(trade)
-                    self.close_positions_widget.add_closed_position(trade)
-                    
-                    # Remove from open positions
-                    del self.positions[i]
-                    self.update_positions_display()
-                    
-                    # Update portfolio after closing position
-                    self.update_portfolio_with_position(None)  # None indicates position closed
-                    
-                    self.append_log(f"Position closed: {symbol} {pos['side']} at {exit_price:.4f}, PnL: ${pnl:.2f}")
-                    
-                    # Send notification
-                    self.notification_service.show_position_alert(
-                        "close", symbol, pos['side'], pos['entry_price'], 
-                        exit_price, pnl
-                    )
-                    break
-                    
+            i = self._position_index(symbol)
+            if i is None:
+                return
+            pos = self.positions[i]
+            
+            # Use the actual price for more realistic PnL calculation
+            exit_price = price
+            
+            # Calculate PnL with very conservative approach
+            # Use micro lots for calculation (1 micro lot = 1,000 units)
+            micro_lots = pos['quantity'] / 1000
+            
+            # Get broker spread from settings
+            broker_spread_pips = self.settings_manager.get('broker_spread', 2.0)  # Default 2 pips
+            spread_cost = broker_spread_pips * micro_lots * 10  # $10 per pip per micro lot
+            
+            if pos['side'] == 'Long':
+                pnl = (exit_price - pos['entry_price']) * micro_lots * 10  # $10 per pip per micro lot
+            else:
+                pnl = (pos['entry_price'] - exit_price) * micro_lots * 10  # $10 per pip per micro lot
+            
+            # Deduct broker spread cost
+            pnl -= spread_cost
+            
+            # Debug PnL calculation
+            self._dlog(lambda: f"PnL Debug - {symbol}: Entry={pos['entry_price']:.4f}, Exit={exit_price:.4f}, Qty={pos['quantity']:.2f}, Spread={spread_cost:.2f}, PnL={pnl:.2f}")
+            
+            # Close order in MT4, queued behind any order still being submitted
+            if self.broker and self.broker.is_connected() and 'order_id' in pos:
+                self._start_worker(self.broker.close_all, symbol,
+                                   on_finished=functools.partial(self._on_broker_closed, symbol),
+                                   on_error=functools.partial(self._on_broker_close_error, symbol),
+                                   pool=self.order_pool)
+            
+            # Create closed trade as Trade object
+            trade = Trade(
+                symbol=symbol,
+                side=1 if pos['side'] == 'Long' else -1,  # Convert to numeric
+                quantity=pos['quantity'],
+                entry_price=pos['entry_price'],
+                exit_price=exit_price,
+                pnl=pnl,
+                strategy='ML_Adaptive_SuperTrend',
+                entry_time=pos['timestamp'],
+                exit_time=datetime.now(),
+                take_profit=pos.get('take_profit'),
+                stop_loss=pos.get('stop_loss'),
+                management_notes='Signal Close'
+            )
+            
+            self._record_closed_trade(trade)
+            self.close_positions_widget.add_closed_position(trade)
+            
+            # Remove from open positions
+            self._remove_position(i)
+            self._dirty.add('positions')
+            self.update_positions_display()
+            
+            # Update portfolio after closing position
+            self.update_portfolio_with_position(None)  # None indicates position closed
+            
+            self.append_log(f"Position closed: {symbol} {pos['side']} at {exit_price:.4f}, PnL: ${pnl:.2f}")
+            
+            # Send notification
+            self.notification_service.show_position_alert(
+                "close", symbol, pos['side'], pos['entry_price'], 
+                exit_price, pnl
+            )
+            
         except Exception as e:
             self.append_log(f"Error closing position: {str(e)}")
     
+    def _on_broker_closed(self, symbol, close_success):
+        """Log the outcome of a close_all command run on the order pool."""
+        if close_success:
+            self.append_log(f"Order closed in MT4 for {symbol}")
+        else:
+            self.append_log(f"Failed to close order in MT4 for {symbol}")
+    
+    def _on_broker_close_error(self, symbol, error):
+        """Handle an exception raised by broker.close_all()."""
+        self.append_log(f"Failed to close order in MT4 for {symbol}: {error}")
+    
     def log_signal_activity(self, symbol, signal, price):
         """Log signal activity for monitoring."""
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -1951,26 +2644,22 @@ class EnhancedMainWindow(QMainWindow):
     def monitor_trading_activity(self):
         """Monitor trading activity and update display."""
         try:
-            if not self.is_trading:
-                # Update monitoring status to inactive
-                self.trading_status_widget.monitoring_status.setText("Inactive")
-                self.trading_status_widget.monitoring_status.setStyleSheet("color: gray; font-weight: bold;")
+            # Only touch the status label when trading starts or stops
+            active = self.is_trading
+            if active != self._monitoring_active:
+                self._monitoring_active = active
+                label = self.trading_status_widget.monitoring_status
+                label.setText("Active" if active else "Inactive")
+                label.setStyleSheet(_QSS_ACTIVE if active else _QSS_INACTIVE)
+            if not active:
                 return
-                
-            # Update monitoring status to active
-            self.trading_status_widget.monitoring_status.setText("Active")
-            self.trading_status_widget.monitoring_status.setStyleSheet("color: green; font-weight: bold;")
-            
-            # Update real-time data
-            self.update_real_time_data()
             
+            # Real-time data is refreshed by the master tick; only log activity here
             # Log activity every 60 seconds (less frequent)
-            if not hasattr(self, 'last_activity_log'):
-                self.last_activity_log = datetime.now()
-            
-            if (datetime.now() - self.last_activity_log).seconds >= 60:
+            now = datetime.now()
+            if (now - self.last_activity_log).seconds >= 60:
                 self.append_log("Trading system active - monitoring for signals...")
-                self.last_activity_log = datetime.now()
+                self.last_activity_log = now
                 
         except Exception as e:
             self.append_log(f"Monitoring error: {str(e)}")
@@ -1978,90 +2667,106 @@ class EnhancedMainWindow(QMainWindow):
     def update_real_time_data(self):
         """Update real-time data display."""
         try:
-            # Debounce: Skip if last update was too recent (within 4 seconds)
-            if not hasattr(self, '_last_update_time'):
-                self._last_update_time = 0
-            import time
-            current_time = time.time()
-            if current_time - self._last_update_time < 4.0:
-                return  # Skip this update
-            self._last_update_time = current_time
-            
-            # Sync positions from MT4 broker if connected
-            if self.broker and self.broker.is_connected():
-                try:
-                    # Get real balance from MT4
-                    real_balance = self.broker.get_balance()
-                    if real_balance:
-                        self.trading_status_widget.balance_label.setText(f"${real_balance:,.2f}")
-                        self.trading_status_widget.equity_label.setText(f"${real_balance:,.2f}")
-                    
-                    # Get real positions from MT4
-                    mt4_positions = self.broker.get_positions()
-                    if mt4_positions:
-                        # Convert Position objects to dictionary format
-                        self.positions = []
-                        current_prices = {}
-                        for symbol, position in mt4_positions.items():
-                            pos_dict = {
-                                'symbol': position.symbol,
-                                'side': 'Long' if position.side > 0 else 'Short',
-                                'entry_price': position.entry_price,
-                                'current_price': position.current_price,
-                                'quantity': position.quantity,
-                                'take_profit': position.take_profit if position.take_profit else 0,
-                                'stop_loss': position.stop_loss if position.stop_loss else 0,
-                                'pnl': position.pnl if hasattr(position, 'pnl') else 0,
-                                'timestamp': datetime.now()
-                            }
-                            self.positions.append(pos_dict)
-                            current_prices[symbol] = position.current_price
-                        
-                        # Update positions widget with Position objects
-                        position_objects = []
-                        for pos_dict in self.positions:
-                            pos_obj = Position(
-                                symbol=pos_dict['symbol'],
-                                side=1 if pos_dict['side'] == 'Long' else -1,
-                                quantity=pos_dict['quantity'],
-                                entry_price=pos_dict['entry_price'],
-                                current_price=pos_dict['current_price'],
-                                stop_loss=pos_dict.get('stop_loss', 0),
-                                take_profit=pos_dict.get('take_profit', 0),
-                                unrealized_pnl=pos_dict.get('pnl', 0)
-                            )
-                            position_objects.append(pos_obj)
-                        
-                        self.open_positions_widget.update_positions(position_objects, current_prices)
-                except Exception as e:
-                    self.append_log(f"Error syncing MT4 data: {str(e)}")
-            
-            # Update portfolio with current positions
-            self.update_portfolio_with_position(None)
+            # The master tick owns the cadence (REALTIME_EVERY_MS), so there is no debounce here
             
-            # Update positions display (fallback if MT4 sync didn't work)
-            if not (self.broker and self.broker.is_connected()):
-                self.update_positions_display()
+            # Sync from MT4 on the order pool if connected, unless the previous fetch is still running
+            connected = bool(self.broker and self.broker.is_connected())
+            if connected and not self._account_sync_pending:
+                self._account_sync_pending = True
+                self._start_worker(self._fetch_account, on_finished=self._on_account_synced,
+                                   on_error=self._on_account_fetch_error, pool=self.order_pool)
+            elif self.positions:
+                # Without a broker feed prices still move, so open positions always need a refresh
+                self._dirty.update(('positions', 'metrics'))
+            
+            self._render_dirty(connected)
             
         except Exception as e:
             self.append_log(f"Real-time update error: {str(e)}")
     
+    def _on_account_synced(self, results):
+        """Apply a periodic balance and positions sync, then repaint what changed."""
+        self._account_sync_pending = False
+        try:
+            if sip.isdeleted(self.trading_status_widget):
+                return
+            (real_balance, balance_error), (mt4_positions, positions_error) = results
+            for error in (balance_error, positions_error):
+                if error is not None:
+                    self.append_log(f"Error syncing MT4 data: {str(error)}")
+            
+            # Get real balance from MT4
+            if real_balance:
+                self._show_broker_balance(real_balance)
+            
+            # Get real positions from MT4
+            if mt4_positions:
+                # Only rebuild positions when MT4 reports something different
+                snapshot = tuple(
+                    (p.symbol, p.side, p.entry_price, p.current_price, p.quantity,
+                     p.take_profit, p.stop_loss, getattr(p, 'pnl', 0))
+                    for p in mt4_positions.values()
+                )
+                if snapshot != self._positions_snapshot:
+                    self._positions_snapshot = snapshot
+                    self._load_broker_positions(mt4_positions)
+                    self._dirty.update(('positions', 'metrics'))
+            
+            self._render_dirty(True)
+            
+        except Exception as e:
+            self.append_log(f"Real-time update error: {str(e)}")
+    
+    def _render_dirty(self, connected=None):
+        """Refresh only the sections whose state changed and that are on screen; the rest stay dirty."""
+        # Nothing is on screen while minimized or hidden
+        if self.isMinimized() or not self.isVisible():
+            return
+        if connected is None:
+            connected = bool(self.broker and self.broker.is_connected())
+        
+        # The positions table lives on the Trading tab
+        if 'positions' in self._dirty and self.features_tabs.currentIndex() in self.LIVE_TABS:
+            self._dirty.discard('positions')
+            if connected:
+                self._render_broker_positions()
+            else:
+                self.update_positions_display()
+        
+        if 'metrics' in self._dirty:
+            self._dirty.discard('metrics')
+            self.update_portfolio_with_position(None)
+    
+    def _on_features_tab_changed(self, index):
+        """Catch up on positions left dirty while another tab was shown."""
+        if index in self.LIVE_TABS:
+            try:
+                self._render_dirty()
+            except Exception as e:
+                self.append_log(f"Real-time update error: {str(e)}")
+    
+    def changeEvent(self, event):
+        """Catch up on sections left dirty while the window was minimized."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and hasattr(self, 'features_tabs') and not self.isMinimized():
+            try:
+                self._render_dirty()
+            except Exception as e:
+                self.append_log(f"Real-time update error: {str(e)}")
+    
+    def _render_broker_positions(self):
+        """Show broker-synced positions in the open positions widget."""
+        # The synced dicts' columns go straight to the widget; no Position objects are needed for display
+        self.open_positions_widget.update_positions(self._position_columns(), {})
+    
     def update_broker_status(self, broker_mode: str):
         """Update the broker status display."""
         try:
             self.trading_status_widget.broker_status.setText(broker_mode)
             
             # Color code based on broker type
-            if broker_mode == "PAPER":
-                self.trading_status_widget.broker_status.setStyleSheet("color: blue; font-weight: bold;")
-            elif broker_mode == "MT4":
-                self.trading_status_widget.broker_status.setStyleSheet("color: orange; font-weight: bold;")
-            elif broker_mode == "REST API":
-                self.trading_status_widget.broker_status.setStyleSheet("color: green; font-weight: bold;")
-            elif broker_mode == "IB TWS":
-                self.trading_status_widget.broker_status.setStyleSheet("color: purple; font-weight: bold;")
-            else:
-                self.trading_status_widget.broker_status.setStyleSheet("color: gray; font-weight: bold;")
+            self._set_color(self.trading_status_widget.broker_status,
+                            _BROKER_QSS.get(broker_mode, _QSS_INACTIVE))
                 
         except Exception as e:
             self.append_log(f"Error updating broker status: {str(e)}")
@@ -2083,9 +2788,16 @@ class EnhancedMainWindow(QMainWindow):
             broker_mode = self.settings_manager.get('broker_mode', 'PAPER')
             self.update_broker_status(broker_mode)
             
+            self._apply_tab_visibility()
+            
+            # Apply changed risk settings; the config object is reused when they are unchanged
+            self.risk_engine.config = self._create_risk_config()
+            
             # Reinitialize broker with new settings
             self.initialize_broker()
             
+            self.debug_logging = DEBUG_TRADES or bool(self.settings_manager.get('debug_logging', False))
+            
             # Apply theme changes
             self.apply_theme()
             
@@ -2112,21 +2824,8 @@ class EnhancedMainWindow(QMainWindow):
         """Show about dialog."""
         QMessageBox.about(
             self,
-            self.language_manager.tr("about", "About ForexSmartBot"),
-            "ForexSmartBot v3.3.0\n\n"
-            "Advanced Trading Platform with Machine Learning Strategies\n\n"
-            "Features:\n"
-            "• Real-time trading\n"
-            "• 17+ Trading Strategies (including 7 ML strategies)\n"
-            "• Strategy Optimization Tools\n"
-            "• Visual Strategy Builder\n"
-            "• Strategy Marketplace\n"
-            "• Advanced Analytics\n"
-            "• Cloud Integration\n"
-            "• Remote Monitoring\n"
-            "• Risk management\n"
-            "• Backtesting\n\n"
-            "© 2026 VoxHash Technologies"
+            self._strings['about'],
+            _ABOUT_TEXT
         )
     
     # Optimization menu handlers
@@ -2477,8 +3176,18 @@ class EnhancedMainWindow(QMainWindow):
         
     def append_log(self, message):
         """Append message to log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        # Formatting is deferred to _flush_log so callers only pay for a deque append
+        self._log_buf.append((datetime.now(), message))
+        
+    def _flush_log(self):
+        """Write all buffered log lines to the log widget in a single append."""
+        buf = self._log_buf
+        if not buf:
+            return
+        # Pop only what is buffered now so lines appended meanwhile wait for the next flush
+        popleft = buf.popleft
+        text = '\n'.join([f"[{ts:%H:%M:%S}] {message}" for ts, message in (popleft() for _ in range(len(buf)))])
+        self.log_text.appendPlainText(text)
         
     def load_settings(self):
         """Load application settings."""
@@ -2500,7 +3209,7 @@ class EnhancedMainWindow(QMainWindow):
             self.notification_service.update_config()
             
             # Load other settings
-            self.append_log(self.language_manager.tr("settings_loaded", "Settings loaded successfully"))
+            self.append_log(self._strings['settings_loaded'])
             
         except Exception as e:
             self.append_log(f"Error loading settings: {str(e)}")
@@ -2508,76 +3217,92 @@ class EnhancedMainWindow(QMainWindow):
     def update_positions_display(self):
         """Update the positions table display from internal positions list."""
         try:
-            # Use the correct widget reference
-            self.open_positions_widget.positions_table.setRowCount(len(self.positions))
+            # Fetch one price per distinct symbol, then refresh every position's PnL in one pass
+            current_prices = {}
+            if self.data_provider:
+                for symbol in {pos['symbol'] for pos in self.positions}:
+                    current_prices[symbol] = self._get_price_cached(symbol)
+            self._refresh_position_pnl(current_prices)
             
-            for i, pos in enumerate(self.positions):
-                # Get current price from data provider
-                symbol = pos['symbol']
-                current_price = self.data_provider.get_latest_price(symbol) if self.data_provider else pos.get('current_price', pos['entry_price'])
-                
-                # Calculate PnL properly
-                if pos['side'] == 'Long':
-                    pnl = (current_price - pos['entry_price']) * pos.get('quantity', 1.0)
-                else:
-                    pnl = (pos['entry_price'] - current_price) * pos.get('quantity', 1.0)
-                
-                # Update PnL in position
-                pos['pnl'] = pnl
-                pos['current_price'] = current_price
-                
-                # Populate table
-                self.open_positions_widget.positions_table.setItem(i, 0, QTableWidgetItem(pos['symbol']))
-                self.open_positions_widget.positions_table.setItem(i, 1, QTableWidgetItem(pos['side']))
-                self.open_positions_widget.positions_table.setItem(i, 2, QTableWidgetItem(f"{pos['entry_price']:.4f}"))
-                self.open_positions_widget.positions_table.setItem(i, 3, QTableWidgetItem(f"{pos.get('take_profit', 0):.4f}"))
-                self.open_positions_widget.positions_table.setItem(i, 4, QTableWidgetItem(f"{pos.get('stop_loss', 0):.4f}"))
+            rows = []
+            fmt = "%.4f".__mod__
+            for pos in self.positions:
+                # Price strings are cached on the position and only reformatted when the prices change
+                prices = (pos['entry_price'], pos.get('take_profit', 0), pos.get('stop_loss', 0))
+                cached = pos.get('_fmt_cache')
+                if cached is None or cached[0] != prices:
+                    cached = pos['_fmt_cache'] = (prices, tuple(map(fmt, prices)))
+                rows.append((pos['symbol'], pos['side']) + cached[1])
                 
                 # Note: PnL and Status columns were removed from the table
                 # PnL is calculated and stored in the position but not displayed in the table
                 # Status is tracked internally but not displayed in the table
-                
+            
+            # Hand the whole table to the model in one update
+            self.open_positions_widget.positions_model.set_rows(rows)
+            
         except Exception as e:
             self.append_log(f"Error updating positions display: {str(e)}")
     
+    def _get_price_cached(self, symbol):
+        """Latest price for a symbol, reusing a quote fetched within PRICE_CACHE_TTL seconds."""
+        now = monotonic()
+        cached = self._price_cache.get(symbol)
+        if cached is not None and now - cached[0] < self.PRICE_CACHE_TTL:
+            return cached[1]
+        price = self.data_provider.get_latest_price(symbol)
+        if price is not None:
+            self._price_cache[symbol] = (now, price)
+        return price
+    
+    def _refresh_position_pnl(self, current_prices):
+        """Recompute current_price and pnl for all open positions with column-wise NumPy math."""
+        if not self.positions:
+            self._open_pnl = 0.0
+            return
+        # Entry, quantity and side columns are reused until the positions change; only prices move
+        cols = self._position_columns()
+        price = np.fromiter((current_prices.get(symbol) or px
+                             for symbol, px in zip(cols.symbols.tolist(), cols.current_price.tolist(), strict=True)),
+                            dtype=float, count=len(cols))
+        cols.current_price = price
+        pnl = (price - cols.entry_price) * cols.quantity * cols.sides
+        for pos, px, value in zip(self.positions, price.tolist(), pnl.tolist(), strict=True):
+            pos['current_price'] = px
+            pos['pnl'] = value
+        self._open_pnl = float(pnl.sum())
+    
+    def _set_color(self, label, qss):
+        """Apply a colour stylesheet to a label only when it differs from the last one applied."""
+        if self._label_qss.get(label) != qss:
+            label.setStyleSheet(qss)
+            self._label_qss[label] = qss
+    
     def update_portfolio_with_position(self, position):
         """Update portfolio with new position for real-time calculations."""
         try:
             # Calculate total PnL from closed trades and open positions
-            closed_pnl = sum(trade.pnl for trade in self.closed_trades)
-            open_pnl = sum(pos.get('pnl', 0) for pos in self.positions)
+            closed_pnl = self._agg['closed_pnl']
+            open_pnl = self._open_pnl
             total_pnl = closed_pnl + open_pnl
             
             # Update balance with closed trades PnL
-            # Get real balance from MT4 broker
-            if self.broker and self.broker.is_connected():
-                base_balance = self.broker.get_balance()
+            # Last balance synced from MT4 on the order pool; no broker round-trip here
+            if self.broker and self.broker.is_connected() and self._broker_balance is not None:
+                base_balance = self._broker_balance
             else:
                 base_balance = 10000.0
             current_balance = base_balance + closed_pnl
             current_equity = current_balance + open_pnl
-
-            # Update trading status display with color coding
-            self.trading_status_widget.balance_label.setText(f"${current_balance:.2f}")
-            if current_balance > base_balance:
-                self.trading_status_widget.balance_label.setStyleSheet("color: green;")
-            elif current_balance < base_balance:
-                self.trading_status_widget.balance_label.setStyleSheet("color: red;")
-            else:
-                self.trading_status_widget.balance_label.setStyleSheet("color: blue;")
             
-            self.trading_status_widget.equity_label.setText(f"${current_equity:.2f}")
-            if current_equity > current_balance:
-                self.trading_status_widget.equity_label.setStyleSheet("color: green;")
-            elif current_equity < current_balance:
-                self.trading_status_widget.equity_label.setStyleSheet("color: red;")
-            else:
-                self.trading_status_widget.equity_label.setStyleSheet("color: blue;")
+            # Quiet market: nothing to format or repaint when the raw values are unchanged
+            state = (base_balance, current_balance, current_equity, self.peak_equity)
+            if state == self._last_portfolio_state:
+                self.update_performance_metrics()
+                return
+            self._last_portfolio_state = state
 
             # Calculate drawdown based on peak equity
-            if not hasattr(self, 'peak_equity'):
-                self.peak_equity = current_equity
-            
             if current_equity > self.peak_equity:
                 self.peak_equity = current_equity
             
@@ -2585,12 +3310,34 @@ class EnhancedMainWindow(QMainWindow):
                 drawdown = ((self.peak_equity - current_equity) / self.peak_equity) * 100
             else:
                 drawdown = 0.0
+            self._current_drawdown = drawdown
+            
+            # Push the tick's values to the status panel in one snapshot
+            self.trading_status_widget.apply_snapshot({
+                'balance_label': f"${current_balance:.2f}",
+                'equity_label': f"${current_equity:.2f}",
+                'drawdown_label': f"{drawdown:.1f}%",
+            })
+            
+            # Update trading status display with color coding
+            if current_balance > base_balance:
+                self._set_color(self.trading_status_widget.balance_label, _QSS_GREEN)
+            elif current_balance < base_balance:
+                self._set_color(self.trading_status_widget.balance_label, _QSS_RED)
+            else:
+                self._set_color(self.trading_status_widget.balance_label, _QSS_BLUE)
+            
+            if current_equity > current_balance:
+                self._set_color(self.trading_status_widget.equity_label, _QSS_GREEN)
+            elif current_equity < current_balance:
+                self._set_color(self.trading_status_widget.equity_label, _QSS_RED)
+            else:
+                self._set_color(self.trading_status_widget.equity_label, _QSS_BLUE)
 
-            self.trading_status_widget.drawdown_label.setText(f"{drawdown:.1f}%")
             if drawdown > 0:
-                self.trading_status_widget.drawdown_label.setStyleSheet("color: red;")
+                self._set_color(self.trading_status_widget.drawdown_label, _QSS_RED)
             else:
-                self.trading_status_widget.drawdown_label.setStyleSheet("color: green;")
+                self._set_color(self.trading_status_widget.drawdown_label, _QSS_GREEN)
 
             # Update performance metrics
             self.update_performance_metrics()
@@ -2602,43 +3349,47 @@ class EnhancedMainWindow(QMainWindow):
         """Update performance metrics display."""
         try:
             # Calculate metrics from closed trades
-            if self.closed_trades:
-                total_trades = len(self.closed_trades)
-                winning_trades = sum(1 for trade in self.closed_trades if trade.pnl > 0)
+            # Running totals are maintained by _record_closed_trade
+            agg = self._agg
+            state = (agg['count'], agg['wins'], agg['gross_profit'], agg['gross_loss'], self._current_drawdown)
+            if state == self._last_metrics_state:
+                return
+            self._last_metrics_state = state
+            if agg['count']:
+                total_trades = agg['count']
+                winning_trades = agg['wins']
                 win_rate = (winning_trades / total_trades) * 100 if total_trades > 0 else 0
                 
-                total_profit = sum(trade.pnl for trade in self.closed_trades if trade.pnl > 0)
-                total_loss = abs(sum(trade.pnl for trade in self.closed_trades if trade.pnl < 0))
+                total_profit = agg['gross_profit']
+                total_loss = agg['gross_loss']
                 profit_factor = total_profit / total_loss if total_loss > 0 else float('inf')
                 
-                # Calculate max drawdown from peak equity
-                max_drawdown = 0.0
-                if hasattr(self, 'peak_equity') and self.peak_equity > 0:
-                    current_equity = self._get_current_balance() + sum(pos.get('pnl', 0) for pos in self.positions)
-                    max_drawdown = ((self.peak_equity - current_equity) / self.peak_equity) * 100
-                    max_drawdown = max(0, max_drawdown)  # Ensure non-negative
+                # Max drawdown from peak equity, as computed by update_portfolio_with_position
+                max_drawdown = max(0, self._current_drawdown)  # Ensure non-negative
                 
                 # Update display
-                self.performance_metrics_widget.total_trades_label.setText(str(total_trades))
-                self.performance_metrics_widget.win_rate_label.setText(f"{win_rate:.1f}%")
-                self.performance_metrics_widget.profit_factor_label.setText(f"{profit_factor:.2f}")
-                self.performance_metrics_widget.max_drawdown_label.setText(f"{max_drawdown:.1f}%")
+                self.performance_metrics_widget.apply_snapshot({
+                    'total_trades_label': str(total_trades),
+                    'win_rate_label': f"{win_rate:.1f}%",
+                    'profit_factor_label': f"{profit_factor:.2f}",
+                    'max_drawdown_label': f"{max_drawdown:.1f}%",
+                })
                 
                 # Color-code win rate
                 if win_rate >= 60:
-                    self.performance_metrics_widget.win_rate_label.setStyleSheet("color: green;")
+                    self._set_color(self.performance_metrics_widget.win_rate_label, _QSS_GREEN)
                 elif win_rate >= 40:
-                    self.performance_metrics_widget.win_rate_label.setStyleSheet("color: orange;")
+                    self._set_color(self.performance_metrics_widget.win_rate_label, _QSS_ORANGE)
                 else:
-                    self.performance_metrics_widget.win_rate_label.setStyleSheet("color: red;")
+                    self._set_color(self.performance_metrics_widget.win_rate_label, _QSS_RED)
                 
                 # Color-code max drawdown
                 if max_drawdown > 10:
-                    self.performance_metrics_widget.max_drawdown_label.setStyleSheet("color: red;")
+                    self._set_color(self.performance_metrics_widget.max_drawdown_label, _QSS_RED)
                 elif max_drawdown > 5:
-                    self.performance_metrics_widget.max_drawdown_label.setStyleSheet("color: orange;")
+                    self._set_color(self.performance_metrics_widget.max_drawdown_label, _QSS_ORANGE)
                 else:
-                    self.performance_metrics_widget.max_drawdown_label.setStyleSheet("color: green;")
+                    self._set_color(self.performance_metrics_widget.max_drawdown_label, _QSS_GREEN)
                     
         except Exception as e:
             self.append_log(f"Error updating performance metrics: {str(e)}")
@@ -2714,87 +3465,80 @@ class EnhancedMainWindow(QMainWindow):
         except Exception as e:
             self.append_log(f"Error handling language settings: {str(e)}")
     
+    def _refresh_strings(self):
+        """Resolve all window-chrome translations for the current language in one pass."""
+        tr = self.language_manager.tr
+        self._strings = {key: tr(key, default) for key, default in self._TR_KEYS}
+    
+    def _suspend_updates(self, lang_code: str):
+        """Stop painting for a language switch; the queued on_language_changed turns it back on."""
+        self.setUpdatesEnabled(False)
+    
     def on_language_changed(self, lang_code: str):
         """Handle language change event."""
         try:
             # Update UI text with new language
+            self._refresh_strings()
             self.update_ui_text()
             self.append_log(f"UI updated to language: {lang_code}")
             
         except Exception as e:
             self.append_log(f"Error updating UI text: {str(e)}")
+        finally:
+            # Panels and window chrome are all retranslated now; repaint them in one pass
+            self.setUpdatesEnabled(True)
     
     def update_ui_text(self):
         """Update UI text based on current language."""
-        try:
-            # Update menu text
-            file_menu = self.menuBar().findChild(QMenu, "File")
-            if file_menu:
-                file_menu.setTitle(self.language_manager.tr("file_menu", "File"))
-            
-            tools_menu = self.menuBar().findChild(QMenu, "Tools")
-            if tools_menu:
-                tools_menu.setTitle(self.language_manager.tr("tools_menu", "Tools"))
-            
-            help_menu = self.menuBar().findChild(QMenu, "Help")
-            if help_menu:
-                help_menu.setTitle(self.language_manager.tr("help_menu", "Help"))
+        # Nothing to do if the UI already shows this language from the current translation tables
+        lm = self.language_manager
+        lang = (lm.current_language, lm.version)
+        if self._last_ui_lang == lang:
+            return
+        self._last_ui_lang = lang
+        
+        # Painting is already suspended by _suspend_updates during a language switch
+        try:
+            # Re-apply every registered menu, action, tab and label text in one pass
+            strings = self._strings
+            bindings = self._i18n_bindings
+            if any(sip.isdeleted(owner) for owner, _, _ in bindings):
+                bindings[:] = [b for b in bindings if not sip.isdeleted(b[0])]
+            for owner, setter, key in bindings:
+                setter(strings[key])
             
             # Update window title
-            self.setWindowTitle(f"{self.language_manager.tr('app_title', 'ForexSmartBot')} - Advanced Trading Platform")
+            self.setWindowTitle(f"{strings['app_title']} - Advanced Trading Platform")
             
             # Update status bar
             if hasattr(self, 'status_bar') and self.status_bar:
-                self.status_bar.showMessage(self.language_manager.tr("ready", "Ready"))
-            
-            # Update Trading Status widget
-            if hasattr(self, 'trading_status_widget'):
-                self.trading_status_widget.update_language(self.language_manager)
-            
-            # Update Strategy Configuration widget
-            if hasattr(self, 'strategy_config_widget'):
-                self.strategy_config_widget.update_language(self.language_manager)
-            
-            # Update Performance Metrics widget
-            if hasattr(self, 'performance_metrics_widget'):
-                self.performance_metrics_widget.update_language(self.language_manager)
-            
-            # Update Trading Controls widget
-            if hasattr(self, 'trading_controls_widget'):
-                self.trading_controls_widget.update_language(self.language_manager)
-            
-            # Update Open Positions widget
-            if hasattr(self, 'open_positions_widget'):
-                self.open_positions_widget.update_language(self.language_manager)
-            
-            # Update Closed Positions widget
-            if hasattr(self, 'close_positions_widget'):
-                self.close_positions_widget.update_language(self.language_manager)
-            
-            # Update Trading Log group box
-            log_group = self.findChild(QGroupBox)
-            if log_group and log_group.title() == "Trading Log":
-                log_group.setTitle(self.language_manager.tr("trading_log", "Trading Log"))
-            
-        except Exception as e:
+                self.status_bar.showMessage(strings['ready'])
+        except RuntimeError as e:
+            # A bound Qt object was deleted underneath us
             self.append_log(f"Error updating UI text: {str(e)}")
             
     def closeEvent(self, event):
         """Handle application close."""
+        # Start the settings write first so it overlaps with broker teardown
         try:
-            # Stop trading
-            if self.is_trading:
-                self.stop_trading()
-                
-            # Disconnect
-            if self.is_connected:
-                self.toggle_connection()
-                
-            # Save settings
-            self.settings_manager.save()
-            
-            event.accept()
-            
-        except Exception as e:
+            save_thread = self.settings_manager.save_async()
+        except RuntimeError as e:
+            save_thread = None
             self.append_log(f"Close error: {str(e)}")
-            event.accept()
\ No newline at end of file
+        
+        # stop_trading() and toggle_connection() log their own failures
+        if self.is_trading:
+            self.stop_trading()
+            
+        # Disconnect (the broker call itself runs on the global thread pool)
+        if self.is_connected:
+            self.toggle_connection()
+        
+        event.accept()
+        
+        # In-flight orders, the disconnect and the settings save share one bounded wait
+        deadline = monotonic() + self.SHUTDOWN_TIMEOUT
+        for pool in (self.order_pool, QThreadPool.globalInstance()):
+            pool.waitForDone(max(0, int((deadline - monotonic()) * 1000)))
+        if save_thread is not None:
+            save_thread.join(timeout=max(0.0, deadline - monotonic()))
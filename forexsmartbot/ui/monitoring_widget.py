@@ -10,8 +10,9 @@ from typing import Optional
 class StrategyMonitorWidget(QWidget):
     """Widget displaying strategy monitoring in the main window."""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, monitor=None):
         super().__init__(parent)
+        self._monitor = monitor  # resolved on the first update when not given
         self.setup_ui()
         self.setup_timer()
     
@@ -37,24 +38,25 @@ class StrategyMonitorWidget(QWidget):
         self.update_timer.timeout.connect(self.update_status)
         self.update_timer.start(5000)  # Update every 5 seconds
     
+    def _resolve_monitor(self):
+        """Shared monitor from the parent window, otherwise a private one; looked up once."""
+        if self._monitor is None:
+            parent = self.parent()
+            while parent:
+                if hasattr(parent, 'strategy_monitor'):
+                    self._monitor = parent.strategy_monitor
+                    break
+                parent = parent.parent()
+            
+            if self._monitor is None:
+                from ..monitoring.strategy_monitor import StrategyMonitor
+                self._monitor = StrategyMonitor()
+        return self._monitor
+    
     def update_status(self):
         """Update strategy status."""
         try:
-            from ..monitoring.strategy_monitor import StrategyMonitor
-            
-            # Try to get shared monitor from parent window, otherwise create new
-            monitor = None
-            if self.parent():
-                parent = self.parent()
-                while parent:
-                    if hasattr(parent, 'strategy_monitor'):
-                        monitor = parent.strategy_monitor
-                        break
-                    parent = parent.parent()
-            
-            if not monitor:
-                monitor = StrategyMonitor()
-            
+            monitor = self._resolve_monitor()
             statuses = monitor.get_strategy_statuses()
             
             if not statuses:
@@ -8,6 +8,17 @@ from PyQt6.QtCore import Qt
 from typing import Dict, Any
 
 
+# Optional main-window feature tabs (translation key, default title); tab_<key>_enabled toggles each
+FEATURE_TABS = (
+    ('analytics', 'Analytics'),
+    ('charts', 'Charts'),
+    ('strategy_builder', 'Strategy Builder'),
+    ('marketplace', 'Marketplace'),
+    ('monitoring', 'Monitoring'),
+    ('cloud', 'Cloud'),
+)
+
+
 class SettingsDialog(QDialog):
     """Settings dialog with multiple tabs."""
     
@@ -325,6 +336,17 @@ class SettingsDialog(QDialog):
         self.show_statusbar_checkbox.setChecked(True)
         layout.addRow(f"{self.tr('show_statusbar', 'Show Status Bar')}:", self.show_statusbar_checkbox)
         
+        # Feature tab visibility
+        tabs_group = QGroupBox(self.tr('feature_tabs', 'Feature Tabs'))
+        tabs_layout = QVBoxLayout(tabs_group)
+        self.feature_tab_checkboxes = {}
+        for key, default in FEATURE_TABS:
+            checkbox = QCheckBox(self.tr(key, default))
+            checkbox.setChecked(True)
+            self.feature_tab_checkboxes[key] = checkbox
+            tabs_layout.addWidget(checkbox)
+        layout.addRow(tabs_group)
+        
         # Notification settings
         notification_group = QGroupBox(self.tr('notifications', 'Notifications'))
         notification_layout = QFormLayout(notification_group)
@@ -399,6 +421,8 @@ class SettingsDialog(QDialog):
         self.window_height_spin.setValue(self.settings_manager.get('window_height', 900))
         self.show_toolbar_checkbox.setChecked(self.settings_manager.get('show_toolbar', True))
         self.show_statusbar_checkbox.setChecked(self.settings_manager.get('show_statusbar', True))
+        for key, checkbox in self.feature_tab_checkboxes.items():
+            checkbox.setChecked(self.settings_manager.get(f'tab_{key}_enabled', True))
         
         # Language settings
         current_lang = self.settings_manager.get('language', 'en')
@@ -482,6 +506,8 @@ class SettingsDialog(QDialog):
             self.settings_manager.set('window_height', self.window_height_spin.value())
             self.settings_manager.set('show_toolbar', self.show_toolbar_checkbox.isChecked())
             self.settings_manager.set('show_statusbar', self.show_statusbar_checkbox.isChecked())
+            for key, checkbox in self.feature_tab_checkboxes.items():
+                self.settings_manager.set(f'tab_{key}_enabled', checkbox.isChecked())
             
             # Language settings
             selected_lang = self.language_combo.currentText()
@@ -0,0 +1,30 @@
+"""Static checks for the enhanced main window module."""
+
+import ast
+from collections import Counter
+from pathlib import Path
+
+MODULE = Path(__file__).resolve().parent.parent / "forexsmartbot" / "ui" / "enhanced_main_window.py"
+
+
+def _class_method_names():
+    """Yield (class name, method names defined directly in its body) for every class in the module."""
+    tree = ast.parse(MODULE.read_text(encoding="utf-8"))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            yield node.name, [item.name for item in node.body
+                              if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))]
+
+
+def test_update_language_defined_at_most_once_per_class():
+    """A second update_language in a class body would silently replace the first."""
+    duplicated = [name for name, methods in _class_method_names()
+                  if methods.count("update_language") > 1]
+    assert duplicated == []
+
+
+def test_no_method_redefined_in_class_body():
+    """No class body defines the same method name twice."""
+    redefined = {name: sorted(m for m, n in Counter(methods).items() if n > 1)
+                 for name, methods in _class_method_names()}
+    assert {name: methods for name, methods in redefined.items() if methods} == {}
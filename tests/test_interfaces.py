@@ -0,0 +1,23 @@
+"""Tests for core data structures."""
+
+import math
+
+from forexsmartbot.core.interfaces import Position, PositionArray
+
+
+def test_position_array_maps_missing_stops_to_nan():
+    """Unset stop loss and take profit become NaN columns; set ones are kept."""
+    positions = [
+        Position(symbol='EURUSD', side=1, quantity=1000, entry_price=1.1, current_price=1.2,
+                 unrealized_pnl=0.0, stop_loss=1.05, take_profit=None),
+        Position(symbol='GBPUSD', side=-1, quantity=2000, entry_price=1.3, current_price=1.25,
+                 unrealized_pnl=0.0),
+    ]
+    cols = PositionArray.from_positions(positions)
+    
+    assert len(cols) == 2
+    assert cols.symbol_to_row == {'EURUSD': 0, 'GBPUSD': 1}
+    assert cols.sides.tolist() == [1, -1]
+    assert cols.stop_loss[0] == 1.05
+    assert math.isnan(cols.take_profit[0])
+    assert math.isnan(cols.stop_loss[1]) and math.isnan(cols.take_profit[1])
@@ -0,0 +1,15 @@
+"""Tests for LanguageManager lookups."""
+
+from forexsmartbot.services.language_manager import LanguageManager
+
+
+def test_active_table_falls_back_to_english():
+    """Keys missing from the current language resolve to English, then to the default."""
+    manager = LanguageManager()
+    manager.translations = {'en': {'ready': 'Ready', 'connect': 'Connect'}, 'fr': {'ready': 'Prêt'}}
+    manager.set_language('fr')
+    
+    assert manager.tr('ready') == 'Prêt'
+    assert manager.tr('connect') == 'Connect'
+    assert manager.tr('missing_key', 'Default') == 'Default'
+    assert manager.tr('missing_key') == 'missing_key'
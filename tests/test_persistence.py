@@ -0,0 +1,38 @@
+"""Tests for SettingsManager persistence."""
+
+import json
+
+from forexsmartbot.services import persistence
+from forexsmartbot.services.persistence import SettingsManager
+
+
+def _fail_dump(obj, fp, **kwargs):
+    """json.dump stand-in that writes a partial document and then fails."""
+    fp.write('{"partial": ')
+    raise OSError("disk full")
+
+
+def test_unchanged_set_skips_write(tmp_path, monkeypatch):
+    """Setting a key to its current value leaves nothing to save."""
+    settings = SettingsManager(config_dir=str(tmp_path))
+    settings.set('theme', 'dark')
+    assert settings.save()
+    
+    settings.set('theme', 'dark')
+    monkeypatch.setattr(persistence.json, 'dump', _fail_dump)
+    assert settings.save()
+    assert json.loads(settings.settings_file.read_text(encoding='utf-8'))['theme'] == 'dark'
+
+
+def test_failed_save_keeps_previous_file(tmp_path, monkeypatch):
+    """A failing write leaves the old settings.json intact and no temporary file behind."""
+    settings = SettingsManager(config_dir=str(tmp_path))
+    settings.set('theme', 'dark')
+    assert settings.save()
+    before = settings.settings_file.read_text(encoding='utf-8')
+    
+    settings.set('theme', 'light')
+    monkeypatch.setattr(persistence.json, 'dump', _fail_dump)
+    assert not settings.save()
+    assert settings.settings_file.read_text(encoding='utf-8') == before
+    assert not (tmp_path / 'settings.json.tmp').exists()